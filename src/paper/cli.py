@@ -20,6 +20,7 @@ from paper.renderer import (
     render_search_results,
     render_section,
     render_skim,
+    _indexes_for,
     _print_ref_footer,
 )
 
@@ -142,7 +143,7 @@ def read(ctx, reference: str, section: str | None, no_refs: bool, max_lines: int
             render_section(matched, refs=refs, registry=registry, doc=doc,
                            max_lines=limit, paper_id=doc.metadata.arxiv_id)
             if refs and registry:
-                _print_ref_footer(registry, doc.metadata.arxiv_id)
+                _print_ref_footer(_indexes_for(doc, registry), doc.metadata.arxiv_id)
         else:
             console.print(f"[red]Section \"{section}\" not found.[/red]")
             console.print("[dim]Available sections:[/dim]")
@@ -0,0 +1,54 @@
+"""JSON encoding for the ~/.papers/ cache files.
+
+Uses orjson when installed (``pip install agent-papers-cli[fast]``) and
+falls back to the standard library otherwise.  Both paths write UTF-8 with
+non-ASCII characters unescaped, so files are interchangeable.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: pip install agent-papers-cli[fast]
+    orjson = None
+
+# Files at least this large are parsed straight from a read-only mmap
+# (orjson only) instead of being copied into a bytes object first.
+MMAP_THRESHOLD = 64 * 1024
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, indented by two spaces by default."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file; raises on missing or corrupted files."""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
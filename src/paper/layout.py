@@ -10,7 +10,6 @@ best available device automatically.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import asdict
@@ -19,6 +18,7 @@ from typing import TYPE_CHECKING
 
 import fitz  # PyMuPDF
 
+from paper import jsonio
 from paper.models import Box, LayoutElement
 from paper.storage import layout_path, has_layout
 
@@ -304,7 +304,7 @@ def save_layout(paper_id: str, elements: list[LayoutElement]) -> None:
     data = [asdict(e) for e in elements]
     path = layout_path(paper_id)
     tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    tmp.write_bytes(jsonio.dumps(data))
     tmp.rename(path)
 
 
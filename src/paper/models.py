@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+from paper import jsonio
+
 
 @dataclass
 class Box:
@@ -102,12 +105,21 @@ class Document:
     links: list[Link] = field(default_factory=list)
     layout_elements: list[LayoutElement] = field(default_factory=list)
 
+    @cached_property
+    def references_section(self) -> Optional[Section]:
+        """The References/Bibliography section, if any (found on first access)."""
+        for section in self.sections:
+            heading_lower = section.heading.lower()
+            if "reference" in heading_lower or "bibliography" in heading_lower:
+                return section
+        return None
+
     def save(self, path: Path) -> None:
-        path.write_text(json.dumps(asdict(self), indent=2, ensure_ascii=False))
+        path.write_bytes(jsonio.dumps(asdict(self)))
 
     @classmethod
     def load(cls, path: Path) -> Document:
-        data = json.loads(path.read_text())
+        data = jsonio.read_json(path)
         meta = Metadata(**data.get("metadata", {}))
         sections = []
         for s in data.get("sections", []):
@@ -140,11 +152,13 @@ class Document:
                 page_start=s.get("page_start", 0),
                 page_end=s.get("page_end", 0),
             ))
+        # Link kinds, markers and URLs repeat heavily; interning them makes
+        # the registry's dedup sets and kind comparisons pointer checks.
         links = [
             Link(
-                kind=lk["kind"],
-                text=lk["text"],
-                url=lk["url"],
+                kind=sys.intern(lk["kind"]),
+                text=sys.intern(lk["text"]),
+                url=sys.intern(lk["url"]),
                 target_page=lk["target_page"],
                 page=lk["page"],
                 span=Span(
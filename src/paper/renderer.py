@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import re
-from dataclasses import dataclass
+import weakref
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterator
 
 from rich.console import Console
 from rich.panel import Panel
@@ -19,8 +24,31 @@ console = Console()
 # Module-level flag set by CLI --include-header to bypass auto-suppression.
 _force_header = False
 
+_WS_RE = re.compile(r"\s+")
+_NUM_RE = re.compile(r"\d+")
+_AUTHOR_RE = re.compile(r"\(?\s*([A-Z][a-z]+)")  # leading surname of a citation
+_YEAR_RE = re.compile(r"\d{4}")
 
-@dataclass
+# Precomputed heading indents by section level (level 1 -> no indent).
+_INDENTS = tuple("  " * i for i in range(16))
+
+
+def _print_lines(lines: list[str]) -> None:
+    """Print markup lines with one console.print call.
+
+    Each line is parsed as markup on its own, as separate prints would, so
+    an unbalanced tag in paper text (e.g. ``a[i]``) cannot style the lines
+    after it.
+    """
+    console.print(Text("\n").join(console.render_str(line) for line in lines))
+
+
+def _indent(level: int) -> str:
+    """Return the indent string for a section level."""
+    return _INDENTS[min(max(level - 1, 0), len(_INDENTS) - 1)]
+
+
+@dataclass(slots=True, frozen=True)
 class RefEntry:
     """A navigable reference shown in output."""
     ref_id: str    # "s3", "e1", "c5", "f1", "t1", "eq1"
@@ -30,6 +58,15 @@ class RefEntry:
 
 
 def build_ref_registry(doc: Document) -> list[RefEntry]:
+    """Return the ref registry for a document.
+
+    The registry is built once per document and cached; see
+    ``_build_ref_registry`` for the ordering.
+    """
+    return _cached_refs(doc)[0]
+
+
+def _build_ref_registry(doc: Document) -> list[RefEntry]:
     """Build the ref registry for a document.
 
     Order: s1..sN (sections), f1..fN (figures), t1..tN (tables),
@@ -60,82 +97,232 @@ def build_ref_registry(doc: Document) -> list[RefEntry]:
             target=elem.label,
         ))
 
-    # External links (unique URLs, in order of first appearance)
+    # External links and citations (unique URLs / markers, in order of
+    # first appearance), classified in a single pass over the links
+    externals: list[RefEntry] = []
+    citations: list[RefEntry] = []
     seen_urls: set[str] = set()
-    ext_idx = 0
-    for link in doc.links:
-        if link.kind == "external" and link.url not in seen_urls:
-            seen_urls.add(link.url)
-            ext_idx += 1
-            registry.append(RefEntry(
-                ref_id=f"e{ext_idx}",
-                kind="external",
-                label=link.text or link.url,
-                target=link.url,
-            ))
-
-    # Citations (unique markers, in order of first appearance)
     seen_cites: set[str] = set()
-    cite_idx = 0
     for link in doc.links:
-        if link.kind == "citation" and link.text not in seen_cites:
-            seen_cites.add(link.text)
-            cite_idx += 1
-            registry.append(RefEntry(
-                ref_id=f"c{cite_idx}",
-                kind="citation",
-                label=link.text,
-                target=link.text,
-            ))
+        if link.kind == "external":
+            if link.url not in seen_urls:
+                seen_urls.add(link.url)
+                externals.append(RefEntry(
+                    ref_id=f"e{len(externals) + 1}",
+                    kind="external",
+                    label=link.text or link.url,
+                    target=link.url,
+                ))
+        elif link.kind == "citation":
+            if link.text not in seen_cites:
+                seen_cites.add(link.text)
+                citations.append(RefEntry(
+                    ref_id=f"c{len(citations) + 1}",
+                    kind="citation",
+                    label=link.text,
+                    target=link.text,
+                ))
+    registry.extend(externals)
+    registry.extend(citations)
 
     return registry
 
 
+@dataclass
+class _Indexes:
+    """Per-document lookup structures derived from the ref registry.
+
+    Citation spans are stored as parallel arrays (starts/ends/ref_ids)
+    sorted by start, so overlap queries can bisect on plain ints.
+    """
+    cite_starts: array = field(default_factory=lambda: array("q"))
+    cite_ends: array = field(default_factory=lambda: array("q"))
+    cite_ref_ids: list[str] = field(default_factory=list)
+    cite_max_len: int = 0  # longest citation span, bounds the bisect window
+    kind_counts: dict[str, int] = field(default_factory=dict)  # registry entries per kind
+    by_id: dict[str, RefEntry] = field(default_factory=dict)  # ref ID -> entry
+    section_refs: dict[str, str] = field(default_factory=dict)  # heading -> ref ID
+    layout_refs: dict[str, str] = field(default_factory=dict)  # element label -> ref ID
+    cite_label_refs: dict[str, str] = field(default_factory=dict)  # marker -> ref ID
+    cite_links: dict[str, Link] = field(default_factory=dict)  # ref ID -> first citation Link
+    external_links: dict[str, Link] = field(default_factory=dict)  # URL -> first external Link
+    layout_by_label: dict[str, LayoutElement] = field(default_factory=dict)  # first wins
+    sections_by_heading: dict[str, Section] = field(default_factory=dict)  # first wins
+    # Sections with spans, sorted by the start of their first span
+    section_starts: array = field(default_factory=lambda: array("q"))
+    section_ends: array = field(default_factory=lambda: array("q"))
+    spanned_sections: list[Section] = field(default_factory=list)
+    # Alternation of all citation markers (longest first), for text-only matching
+    cite_pattern: re.Pattern[str] | None = None
+    cite_first_chars: frozenset[str] = frozenset()  # text without any can't match
+    # Aho-Corasick automaton over the same markers, when pyahocorasick is installed
+    cite_automaton: Any = None
+
+    def section_at(self, offset: int) -> Section | None:
+        """Return the section whose first span contains a raw_text offset."""
+        i = bisect.bisect_right(self.section_starts, offset) - 1
+        if i >= 0 and offset < self.section_ends[i]:
+            return self.spanned_sections[i]
+        return None
+
+    def iter_cite_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (end, ref_id) for non-overlapping citation markers in text."""
+        if self.cite_automaton is not None:
+            for last_idx, (_, ref_id) in self.cite_automaton.iter_long(text):
+                yield last_idx + 1, ref_id
+        elif self.cite_pattern is not None:
+            for match in self.cite_pattern.finditer(text):
+                yield match.end(), self.cite_label_refs[match.group(0)]
+
+    def overlapping_cites(self, start: int, end: int) -> list[tuple[int, int, str]]:
+        """Return (start, end, ref_id) for citations overlapping [start, end)."""
+        starts, ends = self.cite_starts, self.cite_ends
+        # A citation starting at or before start - cite_max_len ends by start.
+        lo = bisect.bisect_right(starts, start - self.cite_max_len)
+        hi = bisect.bisect_left(starts, end)
+        return [
+            (starts[i], ends[i], self.cite_ref_ids[i])
+            for i in range(lo, hi)
+            if ends[i] > start
+        ]
+
+
+def _build_indexes(doc: Document, registry: list[RefEntry]) -> _Indexes:
+    """Build the lookup indexes for a document and its registry."""
+    indexes = _Indexes()
+    counts = indexes.kind_counts
+
+    # Map citation labels to ref IDs, counting entries per kind on the way
+    label_to_ref = indexes.cite_label_refs
+    for entry in registry:
+        counts[entry.kind] = counts.get(entry.kind, 0) + 1
+        indexes.by_id[entry.ref_id] = entry
+        if entry.kind == "section":
+            indexes.section_refs[entry.target] = entry.ref_id
+        elif entry.kind in ("figure", "table", "equation"):
+            indexes.layout_refs[entry.target] = entry.ref_id
+        elif entry.kind == "citation":
+            label_to_ref[entry.label] = entry.ref_id
+    if label_to_ref:
+        markers = sorted(label_to_ref, key=len, reverse=True)
+        indexes.cite_pattern = re.compile("|".join(map(re.escape, markers)))
+        indexes.cite_first_chars = frozenset(m[0] for m in markers if m)
+        indexes.cite_automaton = _build_cite_automaton(label_to_ref)
+
+    spans = []
+    for link in doc.links:
+        if link.kind == "citation" and link.text in label_to_ref:
+            ref_id = label_to_ref[link.text]
+            spans.append((link.span.start, link.span.end, ref_id))
+            indexes.cite_links.setdefault(ref_id, link)
+        elif link.kind == "external":
+            indexes.external_links.setdefault(link.url, link)
+    spans.sort()
+
+    for start, end, ref_id in spans:
+        indexes.cite_starts.append(start)
+        indexes.cite_ends.append(end)
+        indexes.cite_ref_ids.append(ref_id)
+        indexes.cite_max_len = max(indexes.cite_max_len, end - start)
+
+    for section in doc.sections:
+        indexes.sections_by_heading.setdefault(section.heading, section)
+    for elem in doc.layout_elements:
+        indexes.layout_by_label.setdefault(elem.label, elem)
+    spanned = sorted(
+        (s for s in doc.sections if s.spans), key=lambda s: s.spans[0].start,
+    )
+    for section in spanned:
+        indexes.section_starts.append(section.spans[0].start)
+        indexes.section_ends.append(section.spans[0].end)
+    indexes.spanned_sections = spanned
+    return indexes
+
+
+def _content_lines(content: str) -> list[str]:
+    """Split raw section content into stripped, non-blank lines."""
+    return [stripped for line in content.splitlines() if (stripped := line.strip())]
+
+
+def _build_cite_automaton(label_to_ref: dict[str, str]) -> Any:
+    """Build an Aho-Corasick automaton over citation markers.
+
+    Returns None when the optional pyahocorasick package is not installed;
+    callers then fall back to the compiled regex alternation.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for marker, ref_id in label_to_ref.items():
+        automaton.add_word(marker, (marker, ref_id))
+    automaton.make_automaton()
+    return automaton
+
+
+# Registry and indexes per document, keyed by id(doc). Entries are dropped
+# when the document is garbage-collected, and rebuilt when its sections,
+# links, or layout elements change size (e.g. layout detection after load).
+_REF_CACHE: dict[int, tuple[tuple[int, int, int], list[RefEntry], _Indexes]] = {}
+
+
+def _cached_refs(doc: Document) -> tuple[list[RefEntry], _Indexes]:
+    """Return the cached (registry, indexes) for a document, building on miss."""
+    key = id(doc)
+    shape = (len(doc.sections), len(doc.links), len(doc.layout_elements))
+    cached = _REF_CACHE.get(key)
+    if cached is None or cached[0] != shape:
+        if cached is None:
+            weakref.finalize(doc, _REF_CACHE.pop, key, None)
+        registry = _build_ref_registry(doc)
+        cached = (shape, registry, _build_indexes(doc, registry))
+        _REF_CACHE[key] = cached
+    return cached[1], cached[2]
+
+
+def _indexes_for(doc: Document, registry: list[RefEntry]) -> _Indexes:
+    """Return indexes for ``registry``, reusing the cache for the doc's own registry."""
+    cached_registry, indexes = _cached_refs(doc)
+    if registry is cached_registry:
+        return indexes
+    return _build_indexes(doc, registry)
+
+
+@functools.lru_cache(maxsize=4096)
 def _ref_tag(ref_id: str) -> str:
     """Format a ref tag for display."""
     return f"[dim]\\[ref={ref_id}][/dim]"
 
 
-def _section_ref_map(registry: list[RefEntry]) -> dict[str, str]:
-    """Map section headings to their ref IDs."""
-    return {
-        entry.target: entry.ref_id
-        for entry in registry
-        if entry.kind == "section"
-    }
+# (kind, ref prefix, summary noun) in registry order
+_SUMMARY_KINDS = (
+    ("section", "s", "sections"),
+    ("figure", "f", "figures"),
+    ("table", "t", "tables"),
+    ("equation", "eq", "equations"),
+    ("external", "e", "links"),
+    ("citation", "c", "citations"),
+)
 
 
-def _ref_summary(registry: list[RefEntry]) -> str:
-    """Build a compact ref summary line."""
-    sections = [e for e in registry if e.kind == "section"]
-    figures = [e for e in registry if e.kind == "figure"]
-    tables = [e for e in registry if e.kind == "table"]
-    equations = [e for e in registry if e.kind == "equation"]
-    externals = [e for e in registry if e.kind == "external"]
-    citations = [e for e in registry if e.kind == "citation"]
-
+def _ref_summary(kind_counts: dict[str, int]) -> str:
+    """Build a compact ref summary line from per-kind entry counts."""
     parts = []
-    if sections:
-        parts.append(f"s1..s{len(sections)} (sections)")
-    if figures:
-        parts.append(f"f1..f{len(figures)} (figures)")
-    if tables:
-        parts.append(f"t1..t{len(tables)} (tables)")
-    if equations:
-        parts.append(f"eq1..eq{len(equations)} (equations)")
-    if externals:
-        parts.append(f"e1..e{len(externals)} (links)")
-    if citations:
-        parts.append(f"c1..c{len(citations)} (citations)")
+    for kind, prefix, noun in _SUMMARY_KINDS:
+        n = kind_counts.get(kind, 0)
+        if n:
+            parts.append(f"{prefix}1..{prefix}{n} ({noun})")
 
     if not parts:
         return ""
     return " · ".join(parts)
 
 
-def _print_ref_footer(registry: list[RefEntry], paper_id: str = "") -> None:
+def _print_ref_footer(indexes: _Indexes, paper_id: str = "") -> None:
     """Print the ref summary footer."""
-    summary = _ref_summary(registry)
+    summary = _ref_summary(indexes.kind_counts)
     if not summary:
         return
     console.print(f"[dim]Refs: {summary}[/dim]")
@@ -144,20 +331,14 @@ def _print_ref_footer(registry: list[RefEntry], paper_id: str = "") -> None:
     console.print()
 
 
-def _build_cite_span_index(doc: Document, registry: list[RefEntry]) -> list[tuple[int, int, str]]:
-    """Build a list of (start, end, ref_id) for citation links, sorted by start."""
-    # Map citation labels to ref IDs
-    label_to_ref: dict[str, str] = {}
-    for entry in registry:
-        if entry.kind == "citation":
-            label_to_ref[entry.label] = entry.ref_id
+@functools.lru_cache(maxsize=1024)
+def _surname_re(surname: str) -> re.Pattern[str]:
+    """Whole-word pattern for a surname, so "Hu" does not match "Huh".
 
-    spans = []
-    for link in doc.links:
-        if link.kind == "citation" and link.text in label_to_ref:
-            spans.append((link.span.start, link.span.end, label_to_ref[link.text]))
-    spans.sort()
-    return spans
+    The lookarounds reject a letter (word char that is not a digit or
+    underscore) on either side of the name, doing the scan in C.
+    """
+    return re.compile(rf"(?<![^\W\d_]){re.escape(surname)}(?![^\W\d_])")
 
 
 def _find_cite_end_in_text(text: str, link: Link) -> int | None:
@@ -166,8 +347,8 @@ def _find_cite_end_in_text(text: str, link: Link) -> int | None:
     Searches by author surname + year, falling back to year-only
     or bracket pattern for numeric citations.
     """
-    author = re.match(r"\(?\s*([A-Z][a-z]+)", link.text)
-    year_m = re.search(r"\d{4}", link.text)
+    author = _AUTHOR_RE.match(link.text)
+    year_m = _YEAR_RE.search(link.text)
     surname = author.group(1) if author else None
     year = year_m.group(0) if year_m else None
 
@@ -182,33 +363,19 @@ def _find_cite_end_in_text(text: str, link: Link) -> int | None:
     # Strategy 1: surname + year (most precise)
     surname_found = False
     if surname and year:
-        pos = 0
-        while pos < len(text):
-            name_idx = text.find(surname, pos)
-            if name_idx == -1:
-                break
-            # Word boundary check — avoid "Hu" matching "Huh", etc.
-            if name_idx > 0 and text[name_idx - 1].isalpha():
-                pos = name_idx + 1
-                continue
-            end_of_name = name_idx + len(surname)
-            if end_of_name < len(text) and text[end_of_name].isalpha():
-                pos = name_idx + 1
-                continue
+        for name_match in _surname_re(surname).finditer(text):
             surname_found = True
-            window = text[name_idx : name_idx + 150]
-            yr_idx = window.find(year)
+            name_idx = name_match.start()
+            yr_idx = text.find(year, name_idx, name_idx + 150)
             if yr_idx >= 0:
-                return _skip_close(name_idx + yr_idx + len(year))
-            pos = name_idx + 1
+                return _skip_close(yr_idx + len(year))
 
     # Strategy 2: year only — when surname wasn't found in text (cross-line
     # citations) or doesn't exist.  Skipped when surname WAS found to avoid
     # placing "Hao, 2024" at "Huh, 2024" when only one year in text.
     if year and not surname_found:
-        positions = [m.start() for m in re.finditer(re.escape(year), text)]
-        if len(positions) == 1:
-            return _skip_close(positions[0] + len(year))
+        if text.count(year) == 1:
+            return _skip_close(text.find(year) + len(year))
 
     # Strategy 3: numeric citation bracket pattern
     if link.text.startswith("[") and link.text.endswith("]"):
@@ -223,83 +390,86 @@ def annotate_text(
     text: str, doc: Document, registry: list[RefEntry],
     span_start: int = -1, span_end: int = -1,
     seen_refs: set[str] | None = None,
+    indexes: _Indexes | None = None,
 ) -> str:
     """Insert [ref=...] tags inline at citation positions.
 
     Uses character-offset overlap to find which citations are in this text,
     then searches the text for each citation to place the ref tag right
     after it (rather than appending at end).
+
+    ``seen_refs`` carries state across calls: each citation is tagged at
+    its first placed occurrence only, and once every citation has been
+    placed further calls return the text unchanged.
+
+    Callers annotating many lines can pass ``indexes`` (from
+    ``_indexes_for``) to skip the per-call cache lookup.
     """
     if not registry:
         return text
 
-    cite_spans = _build_cite_span_index(doc, registry)
+    if indexes is None:
+        indexes = _indexes_for(doc, registry)
 
-    if span_start >= 0 and span_end >= 0:
-        # Find overlapping citations (skip already-seen refs)
-        overlapping: list[tuple[int, int, str]] = []
-        for cs, ce, ref_id in cite_spans:
-            if cs >= span_end:
-                break
-            if ce > span_start:
-                if seen_refs is None or ref_id not in seen_refs:
-                    overlapping.append((cs, ce, ref_id))
-
-        if not overlapping:
-            return text
+    # Every citation already tagged by an earlier call: nothing left to place
+    if seen_refs is not None and len(seen_refs) >= len(indexes.cite_label_refs):
+        return text
 
-        # Build ref_id -> Link lookup
-        label_to_ref = {e.label: e.ref_id for e in registry if e.kind == "citation"}
-        ref_to_link: dict[str, Link] = {}
-        for link in doc.links:
-            if link.kind == "citation" and link.text in label_to_ref:
-                rid = label_to_ref[link.text]
-                if rid not in ref_to_link:
-                    ref_to_link[rid] = link
-
-        # Find inline insertion positions — only place refs we can locate;
-        # skip unfound refs so the next sentence can claim them.
+    if span_start >= 0 and span_end >= 0:
+        # For each overlapping, not-yet-seen citation, find its inline
+        # insertion position — only place refs we can locate; skip unfound
+        # refs so the next sentence can claim them.
         insertions: list[tuple[int, str]] = []  # (position, ref_id)
+        get_link = indexes.cite_links.get
+        seen = seen_refs if seen_refs is not None else set()
 
-        for _, _, ref_id in overlapping:
-            link = ref_to_link.get(ref_id)
+        for _, _, ref_id in indexes.overlapping_cites(span_start, span_end):
+            if ref_id in seen:
+                continue
+            link = get_link(ref_id)
             pos = _find_cite_end_in_text(text, link) if link else None
             if pos is not None:
                 insertions.append((pos, ref_id))
-                if seen_refs is not None:
-                    seen_refs.add(ref_id)
+                seen.add(ref_id)
 
         if not insertions:
             return text
 
-        # Sort rightmost first for safe insertion (avoids offset shifting)
-        insertions.sort(key=lambda x: -x[0])
-
-        result = text
-        for pos, ref_id in insertions:
-            tag = f" [dim]\\[ref={ref_id}][/dim]"
-            result = result[:pos] + tag + result[pos:]
-
-        return result
-
-    # Fallback: text-based matching for raw content lines without spans
-    label_to_ref_fb: dict[str, str] = {}
-    for entry in registry:
-        if entry.kind == "citation":
-            if seen_refs is None or entry.ref_id not in seen_refs:
-                label_to_ref_fb[entry.label] = entry.ref_id
+        # Splice tags in left to right with a single join. Tags sharing a
+        # position keep the order of the old right-to-left insertion.
+        parts: list[str] = []
+        last = 0
+        for pos, ref_id in sorted(reversed(insertions), key=lambda x: x[0]):
+            parts.append(text[last:pos])
+            parts.append(f" {_ref_tag(ref_id)}")
+            last = pos
+        parts.append(text[last:])
+        return "".join(parts)
+
+    # Fallback: text-based matching for raw content lines without spans.
+    # Most lines contain no marker at all; rule them out with cheap
+    # membership tests before scanning.
+    if not any(ch in text for ch in indexes.cite_first_chars):
+        return text
 
-    annotated = text
-    for marker, ref_id in label_to_ref_fb.items():
-        tag = f" [dim]\\[ref={ref_id}][/dim]"
-        escaped_marker = re.escape(marker)
-        match = re.search(escaped_marker, annotated)
-        if match:
-            annotated = annotated[:match.end()] + tag + annotated[match.end():]
-            if seen_refs is not None:
-                seen_refs.add(ref_id)
+    # One scan over all markers tags the first occurrence of each.
+    parts: list[str] = []
+    placed: set[str] = set()
+    last = 0
+    for end, ref_id in indexes.iter_cite_matches(text):
+        if ref_id in placed or (seen_refs is not None and ref_id in seen_refs):
+            continue
+        placed.add(ref_id)
+        parts.append(text[last:end])
+        parts.append(f" {_ref_tag(ref_id)}")
+        last = end
 
-    return annotated
+    if not parts:
+        return text
+    parts.append(text[last:])
+    if seen_refs is not None:
+        seen_refs.update(placed)
+    return "".join(parts)
 
 
 def render_header(doc: Document) -> None:
@@ -342,34 +512,29 @@ def render_outline(doc: Document, refs: bool = True, show_header: bool = True) -
         render_header(doc)
 
     registry = build_ref_registry(doc) if refs else []
-    sec_refs = _section_ref_map(registry) if refs else {}
+    sec_refs = _indexes_for(doc, registry).section_refs if refs else {}
 
     tree = Tree("[bold]Outline[/bold]", guide_style="dim")
-    # Track tree nodes by level for nesting
-    level_nodes: dict[int, Tree] = {}
+    # Stack of (level, node) for the current heading path, shallowest first
+    stack: list[tuple[int, Tree]] = []
 
     for section in doc.sections:
         label = f"[bold]{section.heading}[/bold]" if section.level == 1 else section.heading
         if refs and section.heading in sec_refs:
             label += f" {_ref_tag(sec_refs[section.heading])}"
-        # Find parent node
-        parent = tree
-        for lvl in range(1, section.level):
-            if lvl in level_nodes:
-                parent = level_nodes[lvl]
+        # Pop siblings and deeper levels; the top is then the parent
+        while stack and stack[-1][0] >= section.level:
+            stack.pop()
+        parent = stack[-1][1] if stack else tree
 
         node = parent.add(label)
-        level_nodes[section.level] = node
-        # Clear deeper levels
-        for lvl in list(level_nodes):
-            if lvl > section.level:
-                del level_nodes[lvl]
+        stack.append((section.level, node))
 
     console.print(tree)
     console.print()
 
     if refs and registry:
-        _print_ref_footer(registry, doc.metadata.arxiv_id)
+        _print_ref_footer(_indexes_for(doc, registry), doc.metadata.arxiv_id)
 
 
 def render_section(section: Section, show_heading: bool = True, refs: bool = True,
@@ -384,12 +549,14 @@ def render_section(section: Section, show_heading: bool = True, refs: bool = Tru
     If max_lines is set, truncate and show a "show more" hint.
     """
     if show_heading:
-        indent = "  " * (section.level - 1)
+        indent = _indent(section.level)
         heading_label = f"{indent}[bold cyan]{section.heading}[/bold cyan]"
         console.print(heading_label)
         console.print()
 
     seen_refs: set[str] = set()
+    annotate = bool(refs and doc and registry)
+    indexes = _indexes_for(doc, registry) if annotate else None
 
     sentences = section.sentences
     total = len(sentences)
@@ -400,17 +567,19 @@ def render_section(section: Section, show_heading: bool = True, refs: bool = Tru
         sentences = sentences[:max_lines]
         truncated = True
 
+    # Collect the body and print it in one call
+    out: list[str] = []
     for sentence in sentences:
         text = sentence.text
-        if refs and doc and registry:
+        if annotate:
             text = annotate_text(text, doc, registry,
                                  span_start=sentence.span.start, span_end=sentence.span.end,
-                                 seen_refs=seen_refs)
-        console.print(f"  {text}")
+                                 seen_refs=seen_refs, indexes=indexes)
+        out.append(f"  {text}")
 
     if not section.sentences and section.content:
         # Fall back to raw content if no sentences parsed
-        lines = [l.strip() for l in section.content.split("\n") if l.strip()]
+        lines = _content_lines(section.content)
         total = len(lines)
         unit = "lines"
         if max_lines and total > max_lines:
@@ -418,10 +587,13 @@ def render_section(section: Section, show_heading: bool = True, refs: bool = Tru
             truncated = True
         for line in lines:
             text = line
-            if refs and doc and registry:
-                text = annotate_text(text, doc, registry, seen_refs=seen_refs)
-            console.print(f"  {text}")
+            if annotate:
+                text = annotate_text(text, doc, registry, seen_refs=seen_refs,
+                                     indexes=indexes)
+            out.append(f"  {text}")
 
+    if out:
+        _print_lines(out)
     console.print()
 
     if truncated:
@@ -443,11 +615,13 @@ def render_full(doc: Document, refs: bool = True, show_header: bool = True) -> N
 
     registry = build_ref_registry(doc) if refs else []
 
-    for section in doc.sections:
-        render_section(section, refs=refs, registry=registry, doc=doc)
+    # Buffer the whole paper and write it to the terminal once on exit
+    with console:
+        for section in doc.sections:
+            render_section(section, refs=refs, registry=registry, doc=doc)
 
-    if refs and registry:
-        _print_ref_footer(registry, doc.metadata.arxiv_id)
+        if refs and registry:
+            _print_ref_footer(_indexes_for(doc, registry), doc.metadata.arxiv_id)
 
 
 def render_skim(doc: Document, num_lines: int = 2, max_level: int | None = None,
@@ -457,41 +631,50 @@ def render_skim(doc: Document, num_lines: int = 2, max_level: int | None = None,
         render_header(doc)
 
     registry = build_ref_registry(doc) if refs else []
-    sec_refs = _section_ref_map(registry) if refs else {}
+    indexes = _indexes_for(doc, registry) if refs else None
+    sec_refs = indexes.section_refs if indexes else {}
+    annotate = bool(refs and registry)
 
     for section in doc.sections:
         if max_level is not None and section.level > max_level:
             continue
 
-        indent = "  " * (section.level - 1)
+        indent = _indent(section.level)
         heading_label = f"{indent}[bold cyan]{section.heading}[/bold cyan]"
         if refs and section.heading in sec_refs:
             heading_label += f" {_ref_tag(sec_refs[section.heading])}"
-        console.print(heading_label)
 
         sentences = section.sentences[:num_lines]
         seen_refs: set[str] = set()
+        out: list[str] = [heading_label]
         if sentences:
             for sent in sentences:
                 text = sent.text
-                if refs and registry:
+                if annotate:
                     text = annotate_text(text, doc, registry,
                                          span_start=sent.span.start, span_end=sent.span.end,
-                                         seen_refs=seen_refs)
-                console.print(f"{indent}  [dim]{text}[/dim]")
+                                         seen_refs=seen_refs, indexes=indexes)
+                out.append(f"{indent}  [dim]{text}[/dim]")
         elif section.content:
             # Fall back to first lines of raw content
-            lines = [l.strip() for l in section.content.split("\n") if l.strip()]
+            lines = _content_lines(section.content)
             for line in lines[:num_lines]:
                 text = line
-                if refs and registry:
-                    text = annotate_text(text, doc, registry, seen_refs=seen_refs)
-                console.print(f"{indent}  [dim]{text}[/dim]")
+                if annotate:
+                    text = annotate_text(text, doc, registry, seen_refs=seen_refs,
+                                         indexes=indexes)
+                out.append(f"{indent}  [dim]{text}[/dim]")
 
+        _print_lines(out)
         console.print()
 
     if refs and registry:
-        _print_ref_footer(registry, doc.metadata.arxiv_id)
+        _print_ref_footer(indexes, doc.metadata.arxiv_id)
+
+
+def _newline_offsets(text: str) -> list[int]:
+    """Offsets of every "\\n" in text, for bisecting match line bounds."""
+    return [m.start() for m in re.finditer("\n", text)]
 
 
 def render_search_results(
@@ -503,60 +686,47 @@ def render_search_results(
         render_header(doc)
 
     registry = build_ref_registry(doc) if refs else []
-    sec_refs = _section_ref_map(registry) if refs else {}
+    sec_refs = _indexes_for(doc, registry).section_refs if refs else {}
 
-    query_lower = query.lower()
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
     match_count = 0
 
     for section in doc.sections:
         text = section.content
-        text_lower = text.lower()
-        pos = 0
+        newlines: list[int] | None = None
 
-        while True:
-            idx = text_lower.find(query_lower, pos)
-            if idx == -1:
-                break
+        for match in pattern.finditer(text):
+            idx = match.start()
             match_count += 1
 
-            # Get context around the match
-            line_start = text.rfind("\n", 0, idx)
-            line_start = 0 if line_start == -1 else line_start + 1
+            # Newline offsets and heading label, once per section that has a match
+            if newlines is None:
+                newlines = _newline_offsets(text)
+                heading_label = section.heading
+                if refs and section.heading in sec_refs:
+                    heading_label += f" {_ref_tag(sec_refs[section.heading])}"
 
-            # Get a few lines of context
-            context_end = idx + len(query)
-            for _ in range(context_lines):
-                next_nl = text.find("\n", context_end)
-                if next_nl == -1:
-                    context_end = len(text)
-                    break
-                context_end = next_nl + 1
+            # Get context around the match: from the start of its line...
+            nl_before = bisect.bisect_left(newlines, idx)
+            line_start = newlines[nl_before - 1] + 1 if nl_before else 0
 
-            context = text[line_start:context_end].strip()
+            # ...through the end of the next few lines
+            context_end = match.end()
+            if context_lines > 0:
+                nl_after = bisect.bisect_left(newlines, context_end) + context_lines - 1
+                context_end = newlines[nl_after] + 1 if nl_after < len(newlines) else len(text)
 
-            # Section heading with ref
-            heading_label = section.heading
-            if refs and section.heading in sec_refs:
-                heading_label += f" {_ref_tag(sec_refs[section.heading])}"
+            context = text[line_start:context_end].strip()
 
             console.print(f"  [bold yellow]Match {match_count}[/bold yellow] in [cyan]{heading_label}[/cyan] (p.{section.page_start + 1})")
 
             # Highlight the match
             highlighted = Text(context)
-            ctx_lower = context.lower()
-            search_pos = 0
-            while True:
-                hi = ctx_lower.find(query_lower, search_pos)
-                if hi == -1:
-                    break
-                highlighted.stylize("bold red", hi, hi + len(query))
-                search_pos = hi + len(query)
+            highlighted.highlight_regex(pattern, "bold red")
 
             console.print(Text("  "), highlighted)
             console.print()
 
-            pos = idx + len(query)
-
     if match_count == 0:
         console.print(f"  [dim]No matches found for \"{query}\"[/dim]")
     else:
@@ -565,7 +735,7 @@ def render_search_results(
     console.print()
 
     if refs and registry:
-        _print_ref_footer(registry, doc.metadata.arxiv_id)
+        _print_ref_footer(_indexes_for(doc, registry), doc.metadata.arxiv_id)
 
     return match_count
 
@@ -576,7 +746,7 @@ def render_highlight_matches(
     """Render highlight search matches with context."""
     if show_header:
         render_header(doc)
-    query_lower = query.lower()
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
 
     if not matches:
         console.print(f"  [dim]No matches found for \"{query}\"[/dim]")
@@ -591,14 +761,7 @@ def render_highlight_matches(
 
         # Highlight the query in context
         highlighted = Text(context)
-        ctx_lower = context.lower()
-        search_pos = 0
-        while True:
-            hi = ctx_lower.find(query_lower, search_pos)
-            if hi == -1:
-                break
-            highlighted.stylize("bold red", hi, hi + len(query))
-            search_pos = hi + len(query)
+        highlighted.highlight_regex(pattern, "bold red")
 
         console.print(Text("  "), highlighted)
         console.print()
@@ -645,15 +808,26 @@ def render_highlight_list(highlights: list[dict], doc: Document, show_header: bo
     console.print()
 
 
+@functools.lru_cache(maxsize=256)
+def _ref_entry_re(num: str) -> re.Pattern[str]:
+    """Pattern for bibliography entry ``num`` (e.g. "[3] ..." or "3. ...")."""
+    return re.compile(
+        rf"(?:^|\n)\s*\[?{re.escape(num)}\]?[\.\)]\s*(.+?)(?=\n\s*\[?\d+\]?[\.\)]|\Z)",
+        re.DOTALL,
+    )
+
+
 def _resolve_citation_text(
-    doc: Document, cite_link: Link | None, entry: RefEntry
+    doc: Document, cite_link: Link | None, entry: RefEntry,
+    ref_section: Section | None = None,
 ) -> str | None:
     """Resolve citation to its full reference text.
 
     Strategy 1: If the link has a target page, open the cached PDF, search
     for the author name on that page, and extract the reference entry.
-    Strategy 2: Search for the citation in a References/Bibliography section
-    using text matching (for numeric citations).
+    Strategy 2: Search for the citation in ``ref_section`` (the document's
+    References/Bibliography section) using text matching (for numeric
+    citations).
     """
     # Strategy 1: Search the target page in the PDF for the author name
     if cite_link and cite_link.target_page >= 0:
@@ -664,25 +838,14 @@ def _resolve_citation_text(
                 return ref_text
 
     # Strategy 2: Search in References/Bibliography section (numeric citations)
-    ref_section = None
-    for section in doc.sections:
-        heading_lower = section.heading.lower()
-        if "reference" in heading_lower or "bibliography" in heading_lower:
-            ref_section = section
-            break
-
     if ref_section:
-        nums = re.findall(r"\d+", entry.label)
+        nums = _NUM_RE.findall(entry.label)
         if nums:
             for num in nums:
-                pattern = re.compile(
-                    rf"(?:^|\n)\s*\[?{re.escape(num)}\]?[\.\)]\s*(.+?)(?=\n\s*\[?\d+\]?[\.\)]|\Z)",
-                    re.DOTALL,
-                )
-                match = pattern.search(ref_section.content)
+                match = _ref_entry_re(num).search(ref_section.content)
                 if match:
                     ref_text = match.group(0).strip()
-                    return re.sub(r"\s+", " ", ref_text)
+                    return _WS_RE.sub(" ", ref_text)
 
     return None
 
@@ -693,201 +856,259 @@ def _extract_ref_from_pdf(pdf_path: Path, cite_link: Link) -> str | None:
     LaTeX named destinations often have inaccurate y-coordinates, so
     we search for the author surname on the target page instead.
     """
-    try:
-        import fitz
-    except ImportError:
-        return None
-
     # Extract author surname from citation text
     # "(Kingma & Ba, 2015)" -> "Kingma"
     # "(Zhao et al., 2024)" -> "Zhao"
     # "Houlsby et al., 2019;" -> "Houlsby"
-    author = re.match(r"\(?\s*([A-Z][a-z]+)", cite_link.text)
+    author = _AUTHOR_RE.match(cite_link.text)
     if not author:
         return None
     surname = author.group(1)
 
     # Also extract the year for disambiguation
-    year_match = re.search(r"\d{4}", cite_link.text)
+    year_match = _YEAR_RE.search(cite_link.text)
     year = year_match.group(0) if year_match else ""
 
     try:
-        with fitz.open(pdf_path) as pdf:
-            page = pdf[cite_link.target_page]
-
-            # Search for "Surname," on the target page
-            instances = page.search_for(f"{surname},")
-            if not instances:
-                instances = page.search_for(surname)
-            if not instances:
-                return None
-
-            # Filter to instances near a column margin (start of a bib entry).
-            # Two-column layouts have left col at ~35-80pt, right col at ~290-320pt.
-            # Entries that appear mid-line (indented continuations or co-author
-            # mentions) have higher x0 values within their column.
-            pw = page.rect.width
-            col2_start = pw / 2 - 20  # ~290 for 612pt page
-            margin_instances = [
-                r for r in instances
-                if r.x0 < 100 or (col2_start < r.x0 < col2_start + 50)
-            ]
-            candidates = margin_instances if margin_instances else instances
-
-            # If multiple matches, prefer the one whose surrounding text
-            # contains the year (disambiguates "Zhao" in other entries)
-            best_rect = candidates[0]
-            if year and len(candidates) > 1:
-                for r in candidates:
-                    clip = fitz.Rect(0, r.y0 - 2, page.rect.width, r.y0 + 40)
-                    nearby = page.get_text("text", clip=clip)
-                    if year in nearby:
-                        best_rect = r
-                        break
-
-            # Extract text from the matched position, constrained to the
-            # correct column in two-column layouts
-            if best_rect.x0 > pw / 2 - 20:
-                # Right column
-                col_left = pw / 2 - 20
-                col_right = pw
-            else:
-                # Left column (or single-column)
-                col_left = 0
-                col_right = pw / 2 - 20 if pw > 500 else pw
-
-            clip = fitz.Rect(col_left, best_rect.y0 + 1, col_right, best_rect.y0 + 42)
-            text = page.get_text("text", clip=clip).strip()
-
-            if not text:
-                return None
-
-            # Clean up and trim to start from the author surname
-            text = re.sub(r"\s+", " ", text)
-            idx = text.find(f"{surname},")
-            if idx == -1:
-                idx = text.find(surname)
-            if idx > 0:
-                text = text[idx:]
-            return text
+        mtime = pdf_path.stat().st_mtime
+    except OSError:
+        return None
+    return _extract_ref_cached(str(pdf_path), mtime, cite_link.target_page, surname, year)
+
+
+# Open PDF handles, keyed by path and tagged with the file's mtime so a
+# re-downloaded PDF is reopened. Insertion order doubles as LRU order.
+_PDF_CACHE: dict[str, tuple[float, Any]] = {}
+_PDF_CACHE_SIZE = 4
+
+
+def _open_pdf(pdf_path: str, mtime: float) -> Any:
+    """Return a cached fitz document for pdf_path, opening it if needed."""
+    import fitz
+
+    cached = _PDF_CACHE.pop(pdf_path, None)
+    if cached is not None:
+        if cached[0] == mtime:
+            _PDF_CACHE[pdf_path] = cached
+            return cached[1]
+        cached[1].close()
+
+    pdf = fitz.open(pdf_path)
+    _PDF_CACHE[pdf_path] = (mtime, pdf)
+    while len(_PDF_CACHE) > _PDF_CACHE_SIZE:
+        _, evicted = _PDF_CACHE.pop(next(iter(_PDF_CACHE)))
+        evicted.close()
+    return pdf
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_ref_cached(
+    pdf_path: str, mtime: float, page_no: int, surname: str, year: str,
+) -> str | None:
+    """Find the bibliography entry for surname/year on a PDF page.
+
+    Memoized per file version (mtime): a paper's bibliography does not
+    change, and a render can resolve the same citation target many times.
+    """
+    try:
+        import fitz
+    except ImportError:
+        return None
+
+    try:
+        page = _open_pdf(pdf_path, mtime)[page_no]
+
+        # Search for "Surname," on the target page
+        instances = page.search_for(f"{surname},")
+        if not instances:
+            instances = page.search_for(surname)
+        if not instances:
+            return None
+
+        # Filter to instances near a column margin (start of a bib entry).
+        # Two-column layouts have left col at ~35-80pt, right col at ~290-320pt.
+        # Entries that appear mid-line (indented continuations or co-author
+        # mentions) have higher x0 values within their column.
+        pw = page.rect.width
+        col2_start = pw / 2 - 20  # ~290 for 612pt page
+        margin_instances = [
+            r for r in instances
+            if r.x0 < 100 or (col2_start < r.x0 < col2_start + 50)
+        ]
+        candidates = margin_instances if margin_instances else instances
+
+        # If multiple matches, prefer the one whose surrounding text
+        # contains the year (disambiguates "Zhao" in other entries).  The
+        # page's words are extracted once for all candidates rather than
+        # running a clipped get_text per candidate.
+        best_rect = candidates[0]
+        if year and len(candidates) > 1:
+            words = page.get_text("words")
+            for r in candidates:
+                if year in _words_in_band(words, r.y0 - 2, r.y0 + 40):
+                    best_rect = r
+                    break
+
+        # Extract text from the matched position, constrained to the
+        # correct column in two-column layouts
+        if best_rect.x0 > pw / 2 - 20:
+            # Right column
+            col_left = pw / 2 - 20
+            col_right = pw
+        else:
+            # Left column (or single-column)
+            col_left = 0
+            col_right = pw / 2 - 20 if pw > 500 else pw
+
+        clip = fitz.Rect(col_left, best_rect.y0 + 1, col_right, best_rect.y0 + 42)
+        text = page.get_text("text", clip=clip).strip()
     except Exception:
         return None
 
+    if not text:
+        return None
+
+    # Clean up and trim to start from the author surname
+    text = _WS_RE.sub(" ", text)
+    idx = text.find(f"{surname},")
+    if idx == -1:
+        idx = text.find(surname)
+    if idx > 0:
+        text = text[idx:]
+    return text
+
+
+def _words_in_band(words: list[tuple], y0: float, y1: float) -> str:
+    """Join the extracted words that overlap the horizontal band y0..y1."""
+    return " ".join(w[4] for w in words if w[3] > y0 and w[1] < y1)
+
 
 def render_goto(doc: Document, ref_id: str, show_header: bool = True) -> bool:
     """Jump to a reference. Returns True if found, False otherwise."""
-    registry = build_ref_registry(doc)
-
-    # Find the entry
-    entry = None
-    for e in registry:
-        if e.ref_id == ref_id:
-            entry = e
-            break
+    _, indexes = _cached_refs(doc)
 
+    entry = indexes.by_id.get(ref_id)
     if entry is None:
         console.print(f"[red]Unknown ref: {ref_id}[/red]")
         console.print("[dim]Use paper outline or paper skim to see available refs.[/dim]")
         return False
 
+    goto = _GOTO_HANDLERS.get(entry.kind)
+    if goto is None:
+        return False
+    return goto(doc, entry, indexes, show_header)
+
+
+def _goto_section(doc: Document, entry: RefEntry, indexes: _Indexes,
+                  show_header: bool) -> bool:
+    """Render a preview of a section ref."""
     max_sentences = 10
     paper_id = doc.metadata.arxiv_id
 
-    if entry.kind == "section":
-        # Find and render a preview of the section
-        for section in doc.sections:
-            if section.heading == entry.target:
-                if show_header:
-                    render_header(doc)
-
-                # Print heading (no section ref — you're already navigating here)
-                indent = "  " * (section.level - 1)
-                heading_label = f"{indent}[bold cyan]{section.heading}[/bold cyan]"
-                console.print(heading_label)
-                console.print()
-
-                # Print up to max_sentences with inline citation refs
-                total = len(section.sentences)
-                shown = section.sentences[:max_sentences]
-                seen_refs: set[str] = set()
-                for sent in shown:
-                    text = annotate_text(sent.text, doc, registry,
-                                         span_start=sent.span.start, span_end=sent.span.end,
-                                         seen_refs=seen_refs)
-                    console.print(f"  {text}")
+    section = indexes.sections_by_heading.get(entry.target)
+    if section is None:
+        console.print(f"[red]Section not found: {entry.target}[/red]")
+        return False
 
-                if not shown and section.content:
-                    lines = [l.strip() for l in section.content.split("\n") if l.strip()]
-                    total = len(lines)
-                    for line in lines[:max_sentences]:
-                        text = annotate_text(line, doc, registry, seen_refs=seen_refs)
-                        console.print(f"  {text}")
+    if show_header:
+        render_header(doc)
 
-                console.print()
+    # Print heading (no section ref — you're already navigating here)
+    indent = _indent(section.level)
+    heading_label = f"{indent}[bold cyan]{section.heading}[/bold cyan]"
+    console.print(heading_label)
+    console.print()
 
-                if total > max_sentences:
-                    console.print(f"[dim]Showing {max_sentences} of {total} sentences. Full section: paper read {paper_id} \"{section.heading}\"[/dim]")
-                    console.print()
+    # Print up to max_sentences with inline citation refs
+    registry, _ = _cached_refs(doc)
+    total = len(section.sentences)
+    shown = section.sentences[:max_sentences]
+    seen_refs: set[str] = set()
+    for sent in shown:
+        text = annotate_text(sent.text, doc, registry,
+                             span_start=sent.span.start, span_end=sent.span.end,
+                             seen_refs=seen_refs, indexes=indexes)
+        console.print(f"  {text}")
 
-                _print_ref_footer(registry, paper_id)
-                return True
-        console.print(f"[red]Section not found: {entry.target}[/red]")
-        return False
+    if not shown and section.content:
+        lines = _content_lines(section.content)
+        total = len(lines)
+        for line in lines[:max_sentences]:
+            text = annotate_text(line, doc, registry, seen_refs=seen_refs,
+                                 indexes=indexes)
+            console.print(f"  {text}")
 
-    elif entry.kind == "external":
-        if show_header:
-            render_header(doc)
-        console.print(f"  [bold]Link {entry.ref_id}:[/bold] {entry.target}")
-        # Find context: which page/section this link appeared in
-        for link in doc.links:
-            if link.kind == "external" and link.url == entry.target:
-                # Find containing section
-                for section in doc.sections:
-                    if section.spans:
-                        sec_start = section.spans[0].start
-                        sec_end = section.spans[0].end
-                        if sec_start <= link.span.start < sec_end:
-                            console.print(f"  [dim]Found in: {section.heading} (p.{link.page + 1})[/dim]")
-                            break
-                break
-        console.print()
-        return True
+    console.print()
 
-    elif entry.kind == "citation":
-        if show_header:
-            render_header(doc)
-        console.print(f"  [bold]Citation {entry.ref_id}:[/bold] {entry.label}")
+    if total > max_sentences:
+        console.print(f"[dim]Showing {max_sentences} of {total} sentences. Full section: paper read {paper_id} \"{section.heading}\"[/dim]")
         console.print()
 
-        # Find the matching Link to get target coordinates
-        cite_link = None
-        for link in doc.links:
-            if link.kind == "citation" and link.text == entry.label:
-                cite_link = link
-                break
+    _print_ref_footer(indexes, paper_id)
+    return True
 
-        ref_text = _resolve_citation_text(doc, cite_link, entry)
-        if ref_text:
-            console.print(f"  [dim]{ref_text}[/dim]")
-        else:
-            console.print("  [dim]Could not resolve reference text.[/dim]")
-        console.print()
-        return True
 
-    elif entry.kind in ("figure", "table", "equation"):
-        # Find matching layout element
-        for elem in doc.layout_elements:
-            if elem.label == entry.target:
-                if show_header:
-                    render_header(doc)
-                _render_layout_element(elem, entry.ref_id)
-                return True
-        console.print(f"[red]Layout element not found: {entry.target}[/red]")
-        return False
+def _goto_external(doc: Document, entry: RefEntry, indexes: _Indexes,
+                   show_header: bool) -> bool:
+    """Show an external link ref and where it appears."""
+    if show_header:
+        render_header(doc)
+    console.print(f"  [bold]Link {entry.ref_id}:[/bold] {entry.target}")
+    # Find context: which page/section this link appeared in
+    link = indexes.external_links.get(entry.target)
+    if link is not None:
+        section = indexes.section_at(link.span.start)
+        if section is not None:
+            console.print(f"  [dim]Found in: {section.heading} (p.{link.page + 1})[/dim]")
+    console.print()
+    return True
+
 
+def _goto_citation(doc: Document, entry: RefEntry, indexes: _Indexes,
+                   show_header: bool) -> bool:
+    """Show a citation ref with its resolved reference text."""
+    if show_header:
+        render_header(doc)
+    console.print(f"  [bold]Citation {entry.ref_id}:[/bold] {entry.label}")
+    console.print()
+
+    # The first Link for this citation carries the target coordinates
+    cite_link = indexes.cite_links.get(entry.ref_id)
+
+    ref_text = _resolve_citation_text(doc, cite_link, entry,
+                                       doc.references_section)
+    if ref_text:
+        console.print(f"  [dim]{ref_text}[/dim]")
+    else:
+        console.print("  [dim]Could not resolve reference text.[/dim]")
+    console.print()
+    return True
+
+
+def _goto_layout(doc: Document, entry: RefEntry, indexes: _Indexes,
+                 show_header: bool) -> bool:
+    """Show a figure, table, or equation ref."""
+    elem = indexes.layout_by_label.get(entry.target)
+    if elem is not None:
+        if show_header:
+            render_header(doc)
+        _render_layout_element(elem, entry.ref_id)
+        return True
+    console.print(f"[red]Layout element not found: {entry.target}[/red]")
     return False
 
 
+# render_goto handlers by ref kind
+_GOTO_HANDLERS = {
+    "section": _goto_section,
+    "external": _goto_external,
+    "citation": _goto_citation,
+    "figure": _goto_layout,
+    "table": _goto_layout,
+    "equation": _goto_layout,
+}
+
+
 def _render_layout_element(elem: LayoutElement, ref_id: str) -> None:
     """Render a single layout element (figure, table, or equation)."""
     kind_style = {"figure": "green", "table": "blue", "equation": "magenta"}
@@ -914,7 +1135,7 @@ def render_layout_list(
     if show_header:
         render_header(doc)
 
-    registry = build_ref_registry(doc)
+    _, indexes = _cached_refs(doc)
     elements = doc.layout_elements
     if kind:
         elements = [e for e in elements if e.kind == kind]
@@ -926,17 +1147,12 @@ def render_layout_list(
         console.print()
         return
 
-    ref_map: dict[str, str] = {}
-    for entry in registry:
-        if entry.kind in ("figure", "table", "equation"):
-            ref_map[entry.target] = entry.ref_id
-
     for elem in elements:
-        ref_id = ref_map.get(elem.label, "")
+        ref_id = indexes.layout_refs.get(elem.label, "")
         _render_layout_element(elem, ref_id)
 
     kind_label = kind or "element"
     console.print(f"  [dim]{len(elements)} {kind_label}(s) detected[/dim]")
     console.print()
 
-    _print_ref_footer(registry, doc.metadata.arxiv_id)
+    _print_ref_footer(indexes, doc.metadata.arxiv_id)
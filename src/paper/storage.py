@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
 import logging
+import os
+import stat
 import time
 from pathlib import Path
 from typing import Optional
 
+from paper import jsonio
+
 logger = logging.getLogger(__name__)
 
 PAPERS_DIR = Path.home() / ".papers"
 
 
+@functools.lru_cache(maxsize=1024)
 def _sanitize_paper_id(paper_id: str) -> str:
     """Sanitize a paper ID for safe use as a directory name."""
     paper_id = paper_id.strip()
@@ -27,8 +33,8 @@ def _sanitize_paper_id(paper_id: str) -> str:
 def _safe_json_load(path: Path, fallback=None):
     """Load JSON from a file, returning fallback if corrupted."""
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, ValueError):
+        return jsonio.read_json(path)
+    except ValueError:  # includes json/orjson JSONDecodeError
         logger.warning("Corrupted JSON file: %s — ignoring", path)
         return fallback
 
@@ -44,6 +50,11 @@ def paper_dir(paper_id: str) -> Path:
     return d
 
 
+def _cached_file_exists(paper_id: str, name: str) -> bool:
+    """Check for a cached file without creating the paper directory."""
+    return os.path.exists(os.path.join(PAPERS_DIR, _sanitize_paper_id(paper_id), name))
+
+
 def pdf_path(paper_id: str) -> Path:
     return paper_dir(paper_id) / "paper.pdf"
 
@@ -61,22 +72,40 @@ def annotated_pdf_path(paper_id: str) -> Path:
 
 
 def has_pdf(paper_id: str) -> bool:
-    return pdf_path(paper_id).exists()
+    return _cached_file_exists(paper_id, "paper.pdf")
 
 
 def has_parsed(paper_id: str) -> bool:
-    return parsed_path(paper_id).exists()
+    return _cached_file_exists(paper_id, "parsed.json")
+
+
+# Parsed metadata.json per path, tagged with the file's st_mtime_ns so an
+# edit on disk (by another process or the user) invalidates the entry.
+_metadata_cache: dict[Path, tuple[int, dict]] = {}
 
 
 def save_metadata(paper_id: str, meta: dict) -> None:
-    metadata_path(paper_id).write_text(json.dumps(meta, indent=2, ensure_ascii=False))
+    p = metadata_path(paper_id)
+    p.write_bytes(jsonio.dumps(meta))
+    _metadata_cache[p] = (p.stat().st_mtime_ns, copy.deepcopy(meta))
 
 
 def load_metadata(paper_id: str) -> Optional[dict]:
     p = metadata_path(paper_id)
-    if p.exists():
-        return _safe_json_load(p, fallback=None)
-    return None
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        _metadata_cache.pop(p, None)
+        return None
+    cached = _metadata_cache.get(p)
+    if cached is None or cached[0] != mtime_ns:
+        meta = _safe_json_load(p, fallback=None)
+        if meta is None:
+            return None
+        cached = _metadata_cache[p] = (mtime_ns, meta)
+    # Callers update the returned dict before saving; hand out a deep copy
+    # so nested values in the cache stay untouched.
+    return copy.deepcopy(cached[1])
 
 
 def save_local_metadata(paper_id: str, source_path: Path) -> None:
@@ -100,10 +129,13 @@ def is_local_cache_stale(paper_id: str) -> bool:
     meta = load_metadata(paper_id)
     if not meta or meta.get("source") != "local":
         return False
-    source_path = Path(meta["source_path"])
-    if not source_path.is_file():
+    try:
+        st = os.stat(meta["source_path"])
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode):
         return False
-    return source_path.stat().st_mtime != meta.get("source_mtime")
+    return st.st_mtime != meta.get("source_mtime")
 
 
 def index_path() -> Path:
@@ -119,7 +151,7 @@ def update_index(paper_id: str, title: str) -> None:
     index[paper_id] = title
     # Atomic write: write to temp file, then rename
     tmp = p.with_suffix(".tmp")
-    tmp.write_text(json.dumps(index, indent=2, ensure_ascii=False))
+    tmp.write_bytes(jsonio.dumps(index, indent=False))
     tmp.rename(p)
 
 
@@ -139,7 +171,7 @@ def layout_path(paper_id: str) -> Path:
 
 
 def has_layout(paper_id: str) -> bool:
-    return layout_path(paper_id).exists()
+    return _cached_file_exists(paper_id, "layout.json")
 
 
 def highlights_path(paper_id: str) -> Path:
@@ -156,7 +188,7 @@ def load_highlights(paper_id: str) -> list[dict]:
 def save_highlights(paper_id: str, highlights: list[dict]) -> None:
     p = highlights_path(paper_id)
     tmp = p.with_suffix(".tmp")
-    tmp.write_text(json.dumps(highlights, indent=2, ensure_ascii=False))
+    tmp.write_bytes(jsonio.dumps(highlights))
     tmp.rename(p)
 
 
@@ -169,20 +201,22 @@ _HEADER_TTL = 300  # seconds — suppress duplicate header for 5 minutes
 def was_header_shown_recently(paper_id: str) -> bool:
     """Check if the header was recently shown for this paper."""
     try:
-        data = json.loads(_LAST_HEADER_PATH.read_text())
+        data = jsonio.loads(_LAST_HEADER_PATH.read_bytes())
         if data.get("paper_id") == paper_id:
             return (time.time() - data.get("timestamp", 0)) < _HEADER_TTL
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+    except (FileNotFoundError, ValueError, KeyError):
         pass
     return False
 
 
 def mark_header_shown(paper_id: str) -> None:
-    """Record that the header was displayed for this paper."""
+    """Record that the header was displayed for this paper.
+
+    Written in place rather than via tmp + rename: a torn write only
+    makes was_header_shown_recently return False, which is harmless.
+    """
     ensure_dirs()
-    tmp = _LAST_HEADER_PATH.with_suffix(".tmp")
-    tmp.write_text(json.dumps({
+    _LAST_HEADER_PATH.write_bytes(jsonio.dumps({
         "paper_id": paper_id,
         "timestamp": time.time(),
-    }))
-    tmp.rename(_LAST_HEADER_PATH)
+    }, indent=False))
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import httpx
-
 from search.config import get_jina_key, get_serper_key
+from search.http import get_client, parse_json
 from search.models import BrowseResult
 
 TIMEOUT = 30
@@ -14,7 +13,7 @@ def browse_jina(url: str, *, timeout: int = TIMEOUT) -> BrowseResult:
     """Fetch webpage content using Jina Reader API."""
     api_key = get_jina_key()
 
-    resp = httpx.get(
+    resp = get_client().get(
         f"https://r.jina.ai/{url}",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -23,7 +22,7 @@ def browse_jina(url: str, *, timeout: int = TIMEOUT) -> BrowseResult:
         timeout=timeout,
     )
     resp.raise_for_status()
-    data = resp.json().get("data", {})
+    data = parse_json(resp).get("data", {})
 
     content = data.get("content", "")
     return BrowseResult(
@@ -38,14 +37,14 @@ def browse_serper(url: str, *, timeout: int = TIMEOUT) -> BrowseResult:
     """Fetch webpage content using Serper scrape API."""
     api_key = get_serper_key()
 
-    resp = httpx.post(
+    resp = get_client().post(
         "https://scrape.serper.dev",
         json={"url": url, "includeMarkdown": True},
         headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
         timeout=timeout,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = parse_json(resp)
 
     content = data.get("markdown") or data.get("text", "")
     return BrowseResult(
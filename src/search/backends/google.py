@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import os
-
-import httpx
-
-from search.config import get_serper_key
+from search.config import get_serper_key, getenv
+from search.http import cached_fetch, get_client, loads, parse_json
 from search.models import SearchResult
+from search.util import extract_arxiv_id
 
-TIMEOUT = int(os.getenv("API_TIMEOUT", "10"))
+TIMEOUT = int(getenv("API_TIMEOUT", "10"))
 
 
 def search_web(
@@ -21,30 +19,24 @@ def search_web(
 ) -> list[SearchResult]:
     """Web search via Serper (Google)."""
     api_key = get_serper_key()
-    resp = httpx.post(
+    resp = get_client().post(
         "https://google.serper.dev/search",
         json={"q": query, "num": num_results, "gl": gl, "hl": hl},
         headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
         timeout=TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = parse_json(resp)
 
     results = []
     for item in data.get("organic", []):
-        arxiv_id = ""
         url = item.get("link", "")
-        if "arxiv.org/abs/" in url:
-            arxiv_id = url.split("arxiv.org/abs/")[-1].split("v")[0]
-        elif "arxiv.org/pdf/" in url:
-            arxiv_id = url.split("arxiv.org/pdf/")[-1].replace(".pdf", "").split("v")[0]
-
         results.append(
             SearchResult(
                 title=item.get("title", ""),
                 url=url,
                 snippet=item.get("snippet", ""),
-                arxiv_id=arxiv_id,
+                arxiv_id=extract_arxiv_id(url),
             )
         )
     return results
@@ -57,22 +49,22 @@ def search_scholar(
 ) -> list[SearchResult]:
     """Google Scholar search via Serper."""
     api_key = get_serper_key()
-    resp = httpx.post(
-        "https://google.serper.dev/scholar",
-        json={"q": query, "num": num_results},
-        headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
-        timeout=TIMEOUT,
+    url = "https://google.serper.dev/scholar"
+    payload = {"q": query, "num": num_results}
+    body = cached_fetch(
+        "scholar", url, payload,
+        lambda: get_client().post(
+            url,
+            json=payload,
+            headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
+            timeout=TIMEOUT,
+        ),
     )
-    resp.raise_for_status()
-    data = resp.json()
+    data = loads(body)
 
     results = []
     for item in data.get("organic", []):
         url = item.get("link", "")
-        arxiv_id = ""
-        if "arxiv.org/abs/" in url:
-            arxiv_id = url.split("arxiv.org/abs/")[-1].split("v")[0]
-
         year = item.get("year")
         if isinstance(year, str):
             try:
@@ -2,19 +2,48 @@
 
 from __future__ import annotations
 
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 from xml.etree import ElementTree
 
 import httpx
+from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential
 
+from search.http import cached_fetch, get_client
 from search.models import SearchResult
 
 PUBMED_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 TIMEOUT = 15
+EFETCH_BATCH = 200  # IDs per efetch request
+# NCBI allows 3 requests/second without an API key; two concurrent efetches
+# leave room for the esearch call made in the same second.
+EFETCH_WORKERS = 2
+
+# Element paths within a <PubmedArticle>. Only the Article and PMID lookups
+# search descendants; everything else is a fixed child path from <Article>.
+_ARTICLE = ".//Article"
+_PMID = ".//PMID"
+_AUTHORS = "AuthorList/Author"
+_YEAR = "Journal/JournalIssue/PubDate/Year"
+_VENUE = "Journal/Title"
+
+_WS_RE = re.compile(r"\s+")
+
+
+@retry(
+    retry=retry_if_result(lambda r: r.status_code == 429),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+)
+def _get(client: httpx.Client, url: str, params: dict) -> httpx.Response:
+    return client.get(url, params=params, timeout=TIMEOUT)
 
 
 def _extract_text(tag: ElementTree.Element) -> str:
     """Extract all text from an XML element, including nested rich text."""
-    return " ".join(t.strip() for t in tag.itertext())
+    return _WS_RE.sub(" ", "".join(tag.itertext())).strip()
 
 
 def search_pubmed(
@@ -24,89 +53,114 @@ def search_pubmed(
     offset: int = 0,
 ) -> list[SearchResult]:
     """Search PubMed and return paper results."""
+    client = get_client()
+
     # Step 1: search for IDs
-    resp = httpx.get(
-        f"{PUBMED_BASE}/esearch.fcgi",
-        params={
-            "db": "pubmed",
-            "term": query,
-            "retmax": limit,
-            "retstart": offset,
-            "usehistory": "n",
-            "sort": "relevance",
-        },
-        timeout=TIMEOUT,
+    url = f"{PUBMED_BASE}/esearch.fcgi"
+    params = {
+        "db": "pubmed",
+        "term": query,
+        "retmax": limit,
+        "retstart": offset,
+        "usehistory": "n",
+        "sort": "relevance",
+    }
+    body = cached_fetch(
+        "pubmed", url, params, lambda: _get(client, url, params),
     )
-    resp.raise_for_status()
-    root = ElementTree.fromstring(resp.content)
+    root = ElementTree.fromstring(body)
     ids = [el.text for el in root.findall("./IdList/Id") if el.text]
 
     if not ids:
         return []
 
-    # Step 2: fetch details
-    resp = httpx.get(
-        f"{PUBMED_BASE}/efetch.fcgi",
-        params={
-            "db": "pubmed",
-            "id": ",".join(ids),
-            "retmode": "xml",
-        },
-        timeout=TIMEOUT,
+    # Step 2: fetch details, in concurrent batches for large result sets
+    batches = [ids[i:i + EFETCH_BATCH] for i in range(0, len(ids), EFETCH_BATCH)]
+    if len(batches) == 1:
+        return _efetch(client, batches[0])
+    with ThreadPoolExecutor(max_workers=EFETCH_WORKERS) as pool:
+        return [r for batch in pool.map(lambda b: _efetch(client, b), batches) for r in batch]
+
+
+def _efetch(client: httpx.Client, ids: list[str]) -> list[SearchResult]:
+    """Fetch and parse article details for one batch of PMIDs."""
+    url = f"{PUBMED_BASE}/efetch.fcgi"
+    params = {
+        "db": "pubmed",
+        "id": ",".join(ids),
+        "retmode": "xml",
+    }
+    body = cached_fetch(
+        "pubmed", url, params, lambda: _get(client, url, params),
+    )
+    return list(_iter_articles(body))
+
+
+def _iter_articles(xml: bytes) -> Iterator[SearchResult]:
+    """Stream SearchResults out of an efetch response.
+
+    Each <PubmedArticle> is parsed as soon as its end tag is seen and then
+    dropped from the tree, so memory stays bounded by one article.
+    """
+    root = None
+    for event, elem in ElementTree.iterparse(io.BytesIO(xml), events=("start", "end")):
+        if root is None:
+            root = elem
+        elif event == "end" and elem.tag == "PubmedArticle":
+            result = _parse_article(elem)
+            root.clear()
+            if result is not None:
+                yield result
+
+
+def _parse_article(article_el: ElementTree.Element) -> SearchResult | None:
+    """Build a SearchResult from one <PubmedArticle> element."""
+    article = article_el.find(_ARTICLE)
+    if article is None:
+        return None
+
+    pmid_el = article_el.find(_PMID)
+    pmid = pmid_el.text if pmid_el is not None else ""
+
+    title_el = article.find("ArticleTitle")
+    title = _extract_text(title_el) if title_el is not None else ""
+
+    # Build abstract
+    abstract_parts = []
+    abstract_el = article.find("Abstract")
+    if abstract_el is not None:
+        for ab_text in abstract_el.iterfind("AbstractText"):
+            label = ab_text.attrib.get("Label")
+            if label:
+                abstract_parts.append(f"{label}:")
+            abstract_parts.append(_extract_text(ab_text))
+    abstract = " ".join(abstract_parts)
+
+    # Authors
+    authors = []
+    for author in article.iterfind(_AUTHORS):
+        last = author.find("LastName")
+        first = author.find("ForeName")
+        if last is not None and first is not None:
+            authors.append(f"{last.text} {first.text}")
+    author_str = ", ".join(authors[:3])
+    if len(authors) > 3:
+        author_str += ", et al."
+
+    # Year
+    year_el = article.find(_YEAR)
+    year = int(year_el.text) if year_el is not None and year_el.text else None
+
+    # Venue
+    venue_el = article.find(_VENUE)
+    venue = venue_el.text if venue_el is not None else ""
+
+    return SearchResult(
+        title=title,
+        url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        snippet=abstract[:300] if abstract else "",
+        year=year,
+        authors=author_str,
+        venue=venue,
+        paper_id=pmid,
     )
-    resp.raise_for_status()
-    papers = ElementTree.fromstring(resp.content)
-
-    results = []
-    for article_el in papers.findall("./PubmedArticle"):
-        article = article_el.find(".//Article")
-        if article is None:
-            continue
-
-        pmid_el = article_el.find(".//PMID")
-        pmid = pmid_el.text if pmid_el is not None else ""
-
-        title_el = article.find(".//ArticleTitle")
-        title = _extract_text(title_el) if title_el is not None else ""
-
-        # Build abstract
-        abstract_parts = []
-        if article.find(".//Abstract") is not None:
-            for ab_text in article.findall(".//Abstract/AbstractText"):
-                label = ab_text.attrib.get("Label")
-                if label:
-                    abstract_parts.append(f"{label}:")
-                abstract_parts.append(_extract_text(ab_text))
-        abstract = " ".join(abstract_parts)
-
-        # Authors
-        authors = []
-        for author in article.findall(".//Author"):
-            last = author.find("./LastName")
-            first = author.find("./ForeName")
-            if last is not None and first is not None:
-                authors.append(f"{last.text} {first.text}")
-        author_str = ", ".join(authors[:3])
-        if len(authors) > 3:
-            author_str += ", et al."
-
-        # Year
-        year_el = article.find(".//Journal/JournalIssue/PubDate/Year")
-        year = int(year_el.text) if year_el is not None and year_el.text else None
-
-        # Venue
-        venue_el = article.find(".//Journal/Title")
-        venue = venue_el.text if venue_el is not None else ""
-
-        results.append(
-            SearchResult(
-                title=title,
-                url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                snippet=abstract[:300] if abstract else "",
-                year=year,
-                authors=author_str,
-                venue=venue,
-                paper_id=pmid,
-            )
-        )
-    return results
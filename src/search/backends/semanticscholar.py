@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import os
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential
 
-from search.config import get_s2_key
+from search.config import get_s2_key, getenv
+from search.http import cached_fetch, get_client, loads
 from search.models import CitationResult, SearchResult, SnippetResult
 
-TIMEOUT = int(os.getenv("API_TIMEOUT", "15"))
+TIMEOUT = int(getenv("API_TIMEOUT", "15"))
 
 S2_BASE = "https://api.semanticscholar.org/graph/v1"
 PAPER_FIELDS = (
@@ -22,6 +22,7 @@ CITATION_FIELDS = (
     "paperId,corpusId,contexts,intents,isInfluential,"
     "title,abstract,venue,year,authors"
 )
+BATCH_MAX_IDS = 500  # S2 limit for POST /paper/batch
 
 
 def _headers() -> dict[str, str]:
@@ -37,7 +38,25 @@ def _headers() -> dict[str, str]:
     wait=wait_exponential(multiplier=1, min=1, max=8),
 )
 def _get(url: str, **kwargs) -> httpx.Response:
-    return httpx.get(url, **kwargs)
+    return get_client().get(url, **kwargs)
+
+
+@retry(
+    retry=retry_if_result(lambda r: r.status_code == 429),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+)
+def _post(url: str, **kwargs) -> httpx.Response:
+    return get_client().post(url, **kwargs)
+
+
+def _get_json(url: str, params: dict) -> Any:
+    """GET an S2 endpoint and decode the JSON body, via the response cache."""
+    body = cached_fetch(
+        "s2", url, params,
+        lambda: _get(url, params=params, headers=_headers(), timeout=TIMEOUT),
+    )
+    return loads(body)
 
 
 def _extract_arxiv_id(paper: dict) -> str:
@@ -98,14 +117,7 @@ def search_papers(
     if sort:
         params["sort"] = sort
 
-    resp = _get(
-        f"{S2_BASE}/paper/search",
-        params=params,
-        headers=_headers(),
-        timeout=TIMEOUT,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_json(f"{S2_BASE}/paper/search", params)
 
     return [_paper_to_result(p) for p in data.get("data", [])]
 
@@ -127,14 +139,7 @@ def search_snippets(
     if venue:
         params["venue"] = venue
 
-    resp = _get(
-        f"{S2_BASE}/snippet/search",
-        params=params,
-        headers=_headers(),
-        timeout=TIMEOUT,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_json(f"{S2_BASE}/snippet/search", params)
 
     results = []
     for item in data.get("data", []):
@@ -160,14 +165,10 @@ def get_citations(
     offset: int = 0,
 ) -> list[CitationResult]:
     """Get papers that cite the given paper."""
-    resp = _get(
+    data = _get_json(
         f"{S2_BASE}/paper/{paper_id}/citations",
-        params={"offset": offset, "limit": limit, "fields": CITATION_FIELDS},
-        headers=_headers(),
-        timeout=TIMEOUT,
+        {"offset": offset, "limit": limit, "fields": CITATION_FIELDS},
     )
-    resp.raise_for_status()
-    data = resp.json()
 
     results = []
     for item in data.get("data", []):
@@ -193,14 +194,10 @@ def get_references(
     offset: int = 0,
 ) -> list[CitationResult]:
     """Get papers referenced by the given paper."""
-    resp = _get(
+    data = _get_json(
         f"{S2_BASE}/paper/{paper_id}/references",
-        params={"offset": offset, "limit": limit, "fields": CITATION_FIELDS},
-        headers=_headers(),
-        timeout=TIMEOUT,
+        {"offset": offset, "limit": limit, "fields": CITATION_FIELDS},
     )
-    resp.raise_for_status()
-    data = resp.json()
 
     results = []
     for item in data.get("data", []):
@@ -221,11 +218,23 @@ def get_references(
 
 def get_paper_details(paper_id: str) -> SearchResult:
     """Get details for a single paper."""
-    resp = _get(
-        f"{S2_BASE}/paper/{paper_id}",
-        params={"fields": PAPER_FIELDS},
-        headers=_headers(),
-        timeout=TIMEOUT,
-    )
-    resp.raise_for_status()
-    return _paper_to_result(resp.json())
+    data = _get_json(f"{S2_BASE}/paper/{paper_id}", {"fields": PAPER_FIELDS})
+    return _paper_to_result(data)
+
+
+def get_papers_batch(paper_ids: list[str]) -> list[Optional[SearchResult]]:
+    """Get details for several papers with one request per 500 IDs.
+
+    Results are in input order; IDs S2 does not recognise map to None.
+    """
+    url = f"{S2_BASE}/paper/batch"
+    results: list[Optional[SearchResult]] = []
+    for i in range(0, len(paper_ids), BATCH_MAX_IDS):
+        ids = paper_ids[i:i + BATCH_MAX_IDS]
+        params = {"fields": PAPER_FIELDS}
+        body = cached_fetch(
+            "s2", url, {**params, "ids": tuple(ids)},
+            lambda: _post(url, params=params, json={"ids": ids}, headers=_headers(), timeout=TIMEOUT),
+        )
+        results.extend(_paper_to_result(p) if p else None for p in loads(body))
+    return results
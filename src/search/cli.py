@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Create the Rich console on first use, keeping rich off the import path."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Options shared by several commands; each use still builds its own Option.
+_year_option = click.option(
+    "--year", default=None, help="Year range (e.g., '2020-2024', '2023-').",
+)
+_venue_option = click.option(
+    "--venue", default=None, help="Venue filter (e.g., 'ACL', 'NeurIPS').",
+)
+
+
+def _pagination(default_limit: int, noun: str):
+    """Add the --limit/-n and --offset options."""
+    def decorator(f):
+        f = click.option("--offset", default=0, help="Pagination offset.")(f)
+        return click.option("--limit", "-n", default=default_limit, help=f"Number of {noun}.")(f)
+    return decorator
 
 
 @click.group()
@@ -35,6 +61,7 @@ def env(ctx):
 
     from search.config import PERSISTENT_ENV, check_env
 
+    console = _console()
     statuses = check_env()
     console.print("API Key Status:")
     console.print()
@@ -67,12 +94,12 @@ def env_set(key: str, value: str):
 
     key = key.upper()
     if key not in VALID_KEYS:
-        console.print(f"[red]Unknown key: {key}[/red]")
-        console.print(f"Valid keys: {', '.join(sorted(VALID_KEYS))}")
+        _console().print(f"[red]Unknown key: {key}[/red]")
+        _console().print(f"Valid keys: {', '.join(sorted(VALID_KEYS))}")
         raise SystemExit(1)
 
     path = save_key(key, value)
-    console.print(f"Saved {key} to {path}")
+    _console().print(f"Saved {key} to {path}")
 
 
 # ---------------------------------------------------------------------------
@@ -103,7 +130,7 @@ def google_web(query: str, num: int, gl: str, hl: str):
         results = search_web(query, num_results=num, gl=gl, hl=hl)
         render_search_results(results, source="Google")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -122,7 +149,7 @@ def google_scholar(query: str, num: int):
         results = search_scholar(query, num_results=num)
         render_search_results(results, source="Google Scholar")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -139,12 +166,11 @@ def semanticscholar():
 
 @semanticscholar.command("papers")
 @click.argument("query")
-@click.option("--year", default=None, help="Year range (e.g., '2020-2024', '2023-').")
+@_year_option
 @click.option("--min-citations", default=None, type=int, help="Minimum citation count.")
-@click.option("--venue", default=None, help="Venue filter (e.g., 'ACL', 'NeurIPS').")
+@_venue_option
 @click.option("--sort", default=None, help="Sort order (e.g., 'citationCount:desc').")
-@click.option("--limit", "-n", default=10, help="Number of results.")
-@click.option("--offset", default=0, help="Pagination offset.")
+@_pagination(10, "results")
 def s2_papers(
     query: str,
     year: Optional[str],
@@ -168,15 +194,15 @@ def s2_papers(
         )
         render_search_results(results, source="Semantic Scholar")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
 @semanticscholar.command("snippets")
 @click.argument("query")
-@click.option("--year", default=None, help="Year range filter.")
+@_year_option
 @click.option("--paper-ids", default=None, help="Comma-separated paper IDs to search within.")
-@click.option("--venue", default=None, help="Venue filter.")
+@_venue_option
 @click.option("--limit", "-n", default=10, help="Number of snippets.")
 def s2_snippets(
     query: str,
@@ -196,14 +222,13 @@ def s2_snippets(
         results = search_snippets(query, year=year, paper_ids=paper_ids, venue=venue, limit=limit)
         render_snippet_results(results)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
 @semanticscholar.command("citations")
 @click.argument("paper_id")
-@click.option("--limit", "-n", default=20, help="Number of citations.")
-@click.option("--offset", default=0, help="Pagination offset.")
+@_pagination(20, "citations")
 def s2_citations(paper_id: str, limit: int, offset: int):
     """Show papers that cite the given paper.
 
@@ -216,14 +241,13 @@ def s2_citations(paper_id: str, limit: int, offset: int):
         results = get_citations(paper_id, limit=limit, offset=offset)
         render_citation_results(results, direction="citations")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
 @semanticscholar.command("references")
 @click.argument("paper_id")
-@click.option("--limit", "-n", default=20, help="Number of references.")
-@click.option("--offset", default=0, help="Pagination offset.")
+@_pagination(20, "references")
 def s2_references(paper_id: str, limit: int, offset: int):
     """Show papers referenced by the given paper.
 
@@ -236,7 +260,7 @@ def s2_references(paper_id: str, limit: int, offset: int):
         results = get_references(paper_id, limit=limit, offset=offset)
         render_citation_results(results, direction="references")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -253,6 +277,86 @@ def s2_details(paper_id: str):
     try:
         result = get_paper_details(paper_id)
         render_paper_details(result)
+    except Exception as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+
+_BATCH_OPS = ("details", "citations", "references")
+
+
+def _parse_batch_ops(data: bytes) -> list[dict]:
+    """Decode and validate the op list for ``semanticscholar batch``."""
+    from search.http import loads
+
+    try:
+        ops = loads(data)
+    except ValueError as e:
+        raise click.BadParameter(f"not valid JSON: {e}", param_hint="--json")
+    if not isinstance(ops, list):
+        raise click.BadParameter("expected a JSON list of lookups", param_hint="--json")
+    for op in ops:
+        if not (isinstance(op, dict) and op.get("op") in _BATCH_OPS and op.get("paper_id")):
+            raise click.BadParameter(
+                f"expected {{\"op\": \"details|citations|references\", \"paper_id\": ...}}, "
+                f"got {op!r}",
+                param_hint="--json",
+            )
+        for key in ("limit", "offset"):
+            value = op.get(key, 0)
+            if type(value) is not int or value < 0:
+                raise click.BadParameter(
+                    f"{key} must be a non-negative integer, got {op!r}", param_hint="--json",
+                )
+    return ops
+
+
+@semanticscholar.command("batch")
+@click.option(
+    "--json", "json_file", type=click.File("rb"), default="-",
+    help="JSON file with the lookups to run (default: stdin).",
+)
+def s2_batch(json_file):
+    """Run several paper lookups in one go.
+
+    Reads a JSON list such as
+    [{"op": "details", "paper_id": "arxiv:2302.13971"},
+    {"op": "references", "paper_id": "...", "limit": 10}].
+    All details lookups share a single batch request; citations and
+    references are fetched concurrently.  Results print in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from search.backends.semanticscholar import get_citations, get_papers_batch, get_references
+    from search.renderer import render_citation_results, render_paper_details
+
+    ops = _parse_batch_ops(json_file.read())
+    console = _console()
+    try:
+        lists = {"citations": get_citations, "references": get_references}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            pending = {
+                i: pool.submit(
+                    lists[op["op"]], op["paper_id"],
+                    limit=op.get("limit", 20), offset=op.get("offset", 0),
+                )
+                for i, op in enumerate(ops) if op["op"] in lists
+            }
+            detail_idx = [i for i, op in enumerate(ops) if op["op"] == "details"]
+            details = dict(zip(
+                detail_idx, get_papers_batch([ops[i]["paper_id"] for i in detail_idx]),
+            ))
+            results = {i: f.result() for i, f in pending.items()}
+
+        for i, op in enumerate(ops):
+            console.rule(f"{op['op']} {op['paper_id']}")
+            if op["op"] == "details":
+                if details[i] is None:
+                    console.print("[yellow]Paper not found.[/yellow]")
+                else:
+                    render_paper_details(details[i])
+            else:
+                render_citation_results(results[i], direction=op["op"])
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
@@ -265,8 +369,7 @@ def s2_details(paper_id: str):
 
 @cli.command()
 @click.argument("query")
-@click.option("--limit", "-n", default=10, help="Number of results.")
-@click.option("--offset", default=0, help="Pagination offset.")
+@_pagination(10, "results")
 def pubmed(query: str, limit: int, offset: int):
     """Search PubMed for biomedical literature.
 
@@ -279,7 +382,7 @@ def pubmed(query: str, limit: int, offset: int):
         results = search_pubmed(query, limit=limit, offset=offset)
         render_search_results(results, source="PubMed")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -310,5 +413,5 @@ def browse(url: str, backend: str, timeout: int):
         result = do_browse(url, backend=backend, timeout=timeout)
         render_browse_result(result)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
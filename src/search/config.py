@@ -19,6 +19,7 @@ Required keys per command:
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -27,38 +28,54 @@ from dotenv import load_dotenv
 PAPERS_DIR = Path.home() / ".papers"
 PERSISTENT_ENV = PAPERS_DIR / ".env"
 
-# Load in priority order (earlier loads win because dotenv doesn't overwrite existing)
-# 1. .env in current directory (mid priority)
-load_dotenv()
 
-# 2. ~/.papers/.env (lowest priority — persistent defaults)
-if PERSISTENT_ENV.exists():
-    load_dotenv(PERSISTENT_ENV)
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load the .env files once, on first use rather than at import.
+
+    Priority order (earlier loads win because dotenv doesn't overwrite existing):
+      1. Shell env vars already set (highest priority)
+      2. .env in current directory
+      3. ~/.papers/.env (lowest priority — persistent defaults)
+    """
+    load_dotenv()
+    if PERSISTENT_ENV.exists():
+        load_dotenv(PERSISTENT_ENV)
 
-# 3. Shell env vars already set (highest priority — dotenv won't overwrite)
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """Like os.getenv, but with the .env files loaded first."""
+    _load_env()
+    return os.getenv(name, default)
 
 
 # --- Persistent config ---
 
 def save_key(name: str, value: str) -> Path:
-    """Save an API key to ~/.papers/.env for persistent use."""
-    PAPERS_DIR.mkdir(parents=True, exist_ok=True)
+    """Save an API key to ~/.papers/.env for persistent use.
 
-    # Read existing entries
-    lines: list[str] = []
-    replaced = False
-    if PERSISTENT_ENV.exists():
-        for line in PERSISTENT_ENV.read_text().splitlines():
-            if line.startswith(f"{name}="):
-                lines.append(f"{name}={value}")
-                replaced = True
-            else:
-                lines.append(line)
-
-    if not replaced:
-        lines.append(f"{name}={value}")
+    A new key is appended; an existing one is replaced via an atomic
+    tmp-file rename so a crash never leaves a half-written .env.
+    """
+    PAPERS_DIR.mkdir(parents=True, exist_ok=True)
 
-    PERSISTENT_ENV.write_text("\n".join(lines) + "\n")
+    entry = f"{name}={value}\n"
+    prefix = f"{name}="
+    try:
+        text = PERSISTENT_ENV.read_text()
+    except FileNotFoundError:
+        text = ""
+
+    lines = text.splitlines(keepends=True)
+    if any(line.startswith(prefix) for line in lines):
+        tmp = PERSISTENT_ENV.with_name(PERSISTENT_ENV.name + ".tmp")
+        tmp.write_text("".join(entry if line.startswith(prefix) else line for line in lines))
+        os.replace(tmp, PERSISTENT_ENV)
+    else:
+        with PERSISTENT_ENV.open("a") as f:
+            if text and not text.endswith("\n"):
+                f.write("\n")
+            f.write(entry)
 
     # Also set in current process
     os.environ[name] = value
@@ -69,7 +86,7 @@ def save_key(name: str, value: str) -> Path:
 # --- API key accessors ---
 
 def get_serper_key() -> str:
-    key = os.getenv("SERPER_API_KEY", "")
+    key = getenv("SERPER_API_KEY", "")
     if not key:
         raise ValueError(
             "SERPER_API_KEY is not set. "
@@ -80,11 +97,11 @@ def get_serper_key() -> str:
 
 def get_s2_key() -> str | None:
     """S2 key is optional — returns None if not set."""
-    return os.getenv("S2_API_KEY") or None
+    return getenv("S2_API_KEY") or None
 
 
 def get_jina_key() -> str:
-    key = os.getenv("JINA_API_KEY", "")
+    key = getenv("JINA_API_KEY", "")
     if not key:
         raise ValueError(
             "JINA_API_KEY is not set. "
@@ -115,8 +132,6 @@ ENV_VARS = {
 
 def check_env() -> list[tuple[str, bool, dict]]:
     """Return list of (var_name, is_set, info) for all known env vars."""
-    result = []
-    for var, info in ENV_VARS.items():
-        is_set = bool(os.getenv(var))
-        result.append((var, is_set, info))
-    return result
+    _load_env()
+    env = os.environ
+    return [(var, bool(env.get(var)), info) for var, info in ENV_VARS.items()]
@@ -0,0 +1,126 @@
+"""Shared HTTP client for the search backends.
+
+Every backend goes through one pooled ``httpx.Client`` so that back-to-back
+requests (a search followed by a fetch, or a citation walk hitting the same
+API repeatedly) reuse keep-alive connections instead of paying DNS, TCP and
+TLS setup on each call.  Per-request timeouts are passed at the call site.
+
+Responses from the scholarly APIs can also be cached on disk under
+``~/.papers/.cache/`` by setting ``PAPER_SEARCH_CACHE_TTL`` to a number of
+seconds, so repeating a query skips the network entirely.  The cache is off
+by default so results are always fresh unless asked otherwise.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from paper.jsonio import loads
+from search import config
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.Client | None = None
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=16, max_connections=32, keepalive_expiry=30,
+            ),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def parse_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body straight from its bytes."""
+    return loads(resp.content)
+
+
+def _cache_ttl() -> int:
+    """Seconds a cached API response stays fresh; 0 (the default) disables the cache.
+
+    An empty or non-integer value also disables the cache rather than
+    failing every request.
+    """
+    value = config.getenv("PAPER_SEARCH_CACHE_TTL", "0")
+    try:
+        return int(value)
+    except ValueError:
+        if value.strip():
+            _warn_bad_ttl(value)
+        return 0
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_bad_ttl(value: str) -> None:
+    """Log an invalid PAPER_SEARCH_CACHE_TTL once per distinct value."""
+    logger.warning(
+        "Ignoring PAPER_SEARCH_CACHE_TTL=%r (not an integer); response cache disabled", value,
+    )
+
+
+def _prune_expired(directory: Path, ttl: int) -> None:
+    """Delete cache entries older than ttl so the directory stays bounded."""
+    cutoff = time.time() - ttl
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def cached_fetch(
+    namespace: str,
+    url: str,
+    params: dict,
+    fetch: Callable[[], httpx.Response],
+) -> bytes:
+    """Return the body of a successful response, from the disk cache if fresh.
+
+    The cache key is (url, params); fetch performs the request on a miss.
+    Error responses raise via raise_for_status and are never stored.
+    Each write also prunes expired entries from the namespace directory.
+    """
+    ttl = _cache_ttl()
+    if ttl <= 0:
+        resp = fetch()
+        resp.raise_for_status()
+        return resp.content
+
+    key = repr((url, sorted(params.items()))).encode()
+    digest = hashlib.blake2b(key, digest_size=16).hexdigest()
+    path = config.PAPERS_DIR / ".cache" / namespace / f"{digest}.bin"
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_bytes()
+    except OSError:
+        pass
+
+    resp = fetch()
+    resp.raise_for_status()
+    body = resp.content
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(path)
+        _prune_expired(path.parent, ttl)
+    except OSError:
+        pass  # caching is best-effort
+    return body
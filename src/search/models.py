@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+def _intern(obj, *names: str) -> None:
+    """Intern the named string fields of a frozen result in place.
+
+    Venues and author lists repeat across a page of results, so this keeps
+    one copy of each distinct value.
+    """
+    for name in names:
+        value = getattr(obj, name)
+        if type(value) is str and value:
+            object.__setattr__(obj, name, sys.intern(value))
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """A single search result from any backend."""
 
@@ -20,11 +33,14 @@ class SearchResult:
     paper_id: str = ""
     arxiv_id: str = ""
 
+    def __post_init__(self) -> None:
+        _intern(self, "authors", "venue")
+
     def has_arxiv(self) -> bool:
         return bool(self.arxiv_id) or "arxiv.org" in self.url
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SnippetResult:
     """A snippet search result from Semantic Scholar."""
 
@@ -36,7 +52,7 @@ class SnippetResult:
     score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CitationResult:
     """A citation or reference entry."""
 
@@ -48,8 +64,11 @@ class CitationResult:
     is_influential: bool = False
     contexts: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        _intern(self, "authors", "venue")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BrowseResult:
     """Content extracted from a URL."""
 
@@ -2,34 +2,73 @@
 
 from __future__ import annotations
 
-import re
+from typing import Optional
 
 from rich.console import Console
 from rich.text import Text
 
 from search.models import BrowseResult, CitationResult, SearchResult, SnippetResult
+from search.util import extract_arxiv_id
 
 console = Console()
 
+# Suggestion templates, bound to str.format; list views indent them by two spaces
+_READ_HINT = "> Use `paper read {}` to read this paper".format
+_OUTLINE_HINT = "> Use `paper outline {}` to see its structure".format
+_BROWSE_HINT = "> Use `paper-search browse {}` to read full content".format
+_DETAILS_HINT = "> Use `paper-search semanticscholar details {}` for more info".format
+_CITATIONS_HINT = "> Use `paper-search semanticscholar citations {}` to see who cites this".format
+_REFERENCES_HINT = "> Use `paper-search semanticscholar references {}` to see its references".format
 
-def _detect_arxiv_id(url: str) -> str:
-    """Try to extract an arxiv ID from a URL."""
-    m = re.search(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})", url)
-    return m.group(1) if m else ""
 
+def _result_arxiv_id(result: SearchResult) -> str:
+    """The result's arxiv ID, falling back to parsing its URL."""
+    return result.arxiv_id or extract_arxiv_id(result.url)
 
-def _suggestion_lines(result: SearchResult) -> list[str]:
+
+def _suggestion_lines(result: SearchResult, arxiv_id: str) -> list[str]:
     """Generate suggestive prompt lines for a search result."""
     lines = []
-    arxiv_id = result.arxiv_id or _detect_arxiv_id(result.url)
     if arxiv_id:
-        lines.append(f"  > Use `paper read {arxiv_id}` to read this paper")
-        lines.append(f"  > Use `paper outline {arxiv_id}` to see its structure")
+        lines.append("  " + _READ_HINT(arxiv_id))
+        lines.append("  " + _OUTLINE_HINT(arxiv_id))
     elif result.url:
-        lines.append(f"  > Use `paper-search browse {result.url}` to read full content")
+        lines.append("  " + _BROWSE_HINT(result.url))
     return lines
 
 
+def _format_meta(
+    authors: str,
+    year: Optional[int],
+    venue: str,
+    citation_count: Optional[int] = None,
+) -> str:
+    """Join the non-empty metadata fields of a result with " | "."""
+    parts = (
+        authors,
+        str(year) if year else "",
+        venue,
+        f"cited by {citation_count}" if citation_count is not None else "",
+    )
+    return " | ".join(p for p in parts if p)
+
+
+def _line(text: str, style: str = "") -> Text:
+    """Render a markup string exactly as ``console.print(text, style=style)`` would."""
+    line = console.render_str(text)
+    line.style = style
+    return line
+
+
+def _print_lines(lines: list[Text]) -> None:
+    """Print a whole page of lines with a single console.print call.
+
+    Each console.print call runs Rich's full render pipeline and writes to
+    the terminal, so a page is assembled first and emitted once.
+    """
+    console.print(Text("\n").join(lines))
+
+
 def render_search_results(
     results: list[SearchResult],
     *,
@@ -43,8 +82,7 @@ def render_search_results(
     header = f"Found {len(results)} results"
     if source:
         header += f" from {source}"
-    console.print(header)
-    console.print()
+    lines = [_line(header), Text()]
 
     for i, r in enumerate(results, 1):
         ref = f"r{i}"
@@ -52,38 +90,30 @@ def render_search_results(
         title_line = Text()
         title_line.append(f"[{ref}] ", style="bold cyan")
         title_line.append(r.title, style="bold")
-        console.print(title_line)
+        lines.append(title_line)
 
         # URL
         if r.url:
-            console.print(f"     {r.url}", style="dim")
+            lines.append(_line(f"     {r.url}", "dim"))
 
         # Metadata line
-        meta_parts = []
-        if r.authors:
-            meta_parts.append(r.authors)
-        if r.year:
-            meta_parts.append(str(r.year))
-        if r.venue:
-            meta_parts.append(r.venue)
-        if r.citation_count is not None:
-            meta_parts.append(f"cited by {r.citation_count}")
-        if meta_parts:
-            console.print(f"     {' | '.join(meta_parts)}", style="dim")
+        meta = _format_meta(r.authors, r.year, r.venue, r.citation_count)
+        if meta:
+            lines.append(_line(f"     {meta}", "dim"))
 
         # Snippet
         if r.snippet:
             # Truncate long snippets
-            snippet = r.snippet[:300]
-            if len(r.snippet) > 300:
-                snippet += "..."
-            console.print(f"     {snippet}")
+            snippet = r.snippet if len(r.snippet) <= 300 else r.snippet[:300] + "..."
+            lines.append(_line(f"     {snippet}"))
 
         # Suggestive prompts
-        for line in _suggestion_lines(r):
-            console.print(line, style="dim italic")
+        for line in _suggestion_lines(r, _result_arxiv_id(r)):
+            lines.append(_line(line, "dim italic"))
+
+        lines.append(Text())
 
-        console.print()
+    _print_lines(lines)
 
 
 def render_snippet_results(results: list[SnippetResult]) -> None:
@@ -92,15 +122,14 @@ def render_snippet_results(results: list[SnippetResult]) -> None:
         console.print("[yellow]No snippets found.[/yellow]")
         return
 
-    console.print(f"Found {len(results)} snippets")
-    console.print()
+    lines = [_line(f"Found {len(results)} snippets"), Text()]
 
     for i, s in enumerate(results, 1):
         ref = f"s{i}"
         title_line = Text()
         title_line.append(f"[{ref}] ", style="bold cyan")
         title_line.append(s.paper_title or "(untitled)", style="bold")
-        console.print(title_line)
+        lines.append(title_line)
 
         meta_parts = []
         if s.section:
@@ -110,10 +139,12 @@ def render_snippet_results(results: list[SnippetResult]) -> None:
         if s.score:
             meta_parts.append(f"score: {s.score:.2f}")
         if meta_parts:
-            console.print(f"     {' | '.join(meta_parts)}", style="dim")
+            lines.append(_line(f"     {' | '.join(meta_parts)}", "dim"))
 
-        console.print(f"     {s.text}")
-        console.print()
+        lines.append(_line(f"     {s.text}"))
+        lines.append(Text())
+
+    _print_lines(lines)
 
 
 def render_citation_results(
@@ -126,8 +157,7 @@ def render_citation_results(
         console.print(f"[yellow]No {direction} found.[/yellow]")
         return
 
-    console.print(f"Found {len(results)} {direction}")
-    console.print()
+    lines = [_line(f"Found {len(results)} {direction}"), Text()]
 
     for i, c in enumerate(results, 1):
         ref = f"c{i}"
@@ -136,71 +166,51 @@ def render_citation_results(
         title_line.append(c.title or "(untitled)", style="bold")
         if c.is_influential:
             title_line.append(" *", style="bold yellow")
-        console.print(title_line)
+        lines.append(title_line)
 
-        meta_parts = []
-        if c.authors:
-            meta_parts.append(c.authors)
-        if c.year:
-            meta_parts.append(str(c.year))
-        if c.venue:
-            meta_parts.append(c.venue)
-        if meta_parts:
-            console.print(f"     {' | '.join(meta_parts)}", style="dim")
+        meta = _format_meta(c.authors, c.year, c.venue)
+        if meta:
+            lines.append(_line(f"     {meta}", "dim"))
 
         if c.paper_id:
-            console.print(
-                f"  > Use `paper-search semanticscholar details {c.paper_id}` for more info",
-                style="dim italic",
-            )
+            lines.append(_line("  " + _DETAILS_HINT(c.paper_id), "dim italic"))
 
         if c.contexts:
-            ctx = c.contexts[0][:200]
-            if len(c.contexts[0]) > 200:
-                ctx += "..."
-            console.print(f'     Context: "{ctx}"', style="dim")
+            ctx = c.contexts[0]
+            if len(ctx) > 200:
+                ctx = ctx[:200] + "..."
+            lines.append(_line(f'     Context: "{ctx}"', "dim"))
+
+        lines.append(Text())
 
-        console.print()
+    _print_lines(lines)
 
 
 def render_paper_details(result: SearchResult) -> None:
     """Render detailed info for a single paper."""
-    console.print(result.title, style="bold")
+    lines = [_line(result.title, "bold")]
     if result.url:
-        console.print(result.url, style="dim")
-
-    meta_parts = []
-    if result.authors:
-        meta_parts.append(result.authors)
-    if result.year:
-        meta_parts.append(str(result.year))
-    if result.venue:
-        meta_parts.append(result.venue)
-    if result.citation_count is not None:
-        meta_parts.append(f"cited by {result.citation_count}")
-    if meta_parts:
-        console.print(" | ".join(meta_parts), style="dim")
+        lines.append(_line(result.url, "dim"))
+
+    meta = _format_meta(result.authors, result.year, result.venue, result.citation_count)
+    if meta:
+        lines.append(_line(meta, "dim"))
 
     if result.snippet:
-        console.print()
-        console.print(result.snippet)
+        lines.append(Text())
+        lines.append(_line(result.snippet))
 
     # Suggestions
-    arxiv_id = result.arxiv_id or _detect_arxiv_id(result.url)
+    arxiv_id = _result_arxiv_id(result)
     if arxiv_id:
-        console.print()
-        console.print(f"> Use `paper read {arxiv_id}` to read this paper", style="dim italic")
-        console.print(f"> Use `paper outline {arxiv_id}` to see its structure", style="dim italic")
+        lines.append(Text())
+        lines.append(_line(_READ_HINT(arxiv_id), "dim italic"))
+        lines.append(_line(_OUTLINE_HINT(arxiv_id), "dim italic"))
     if result.paper_id:
-        console.print(
-            f"> Use `paper-search semanticscholar citations {result.paper_id}` to see who cites this",
-            style="dim italic",
-        )
-        console.print(
-            f"> Use `paper-search semanticscholar references {result.paper_id}` to see its references",
-            style="dim italic",
-        )
-    console.print()
+        lines.append(_line(_CITATIONS_HINT(result.paper_id), "dim italic"))
+        lines.append(_line(_REFERENCES_HINT(result.paper_id), "dim italic"))
+    lines.append(Text())
+    _print_lines(lines)
 
 
 def render_browse_result(result: BrowseResult) -> None:
@@ -0,0 +1,19 @@
+"""Small helpers shared by the search backends."""
+
+from __future__ import annotations
+
+import functools
+import re
+
+# New-style (2301.12345) or old-style (hep-th/9901001) ID after an abs/pdf
+# path; any version suffix or ".pdf" is left outside the group.
+_ARXIV_URL_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5}|[\w.-]+/\d{7})")
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_arxiv_id(url: str) -> str:
+    """Return the version-less arxiv ID in an arxiv abs/pdf URL, or ""."""
+    if "arxiv.org" not in url:
+        return ""
+    m = _ARXIV_URL_RE.search(url)
+    return m.group(1) if m else ""
@@ -0,0 +1,17 @@
+"""Shared fixtures for search tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_response_cache(monkeypatch):
+    """Keep mocked API calls off the on-disk response cache."""
+    monkeypatch.setenv("PAPER_SEARCH_CACHE_TTL", "0")
+
+
+@pytest.fixture(autouse=True)
+def _env_files_loaded():
+    """Load .env files up front so tests that unset a key keep it unset."""
+    from search import config
+
+    config._load_env()
@@ -1,5 +1,6 @@
 """Tests for search backends with mocked HTTP calls."""
 
+import json
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -14,19 +15,120 @@ def _mock_response(json_data, status_code=200):
     """Create a mock httpx.Response."""
     mock = MagicMock()
     mock.status_code = status_code
+    mock.content = json.dumps(json_data).encode()
     mock.json.return_value = json_data
     mock.raise_for_status.return_value = None
     return mock
 
 
+# --- Shared HTTP client ---
+
+
+class TestSharedClient:
+    def test_client_is_reused(self):
+        from search.http import get_client
+
+        assert get_client() is get_client()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parse_json(self, use_orjson, monkeypatch):
+        from paper import jsonio
+        from search import http
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(jsonio, "orjson", None)
+        resp = _mock_response({"title": "Über", "n": [1, 2]})
+
+        assert http.parse_json(resp) == {"title": "Über", "n": [1, 2]}
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        from search import config, http
+
+        monkeypatch.setattr(config, "PAPERS_DIR", tmp_path)
+        monkeypatch.setenv("PAPER_SEARCH_CACHE_TTL", "60")
+        return http
+
+    @staticmethod
+    def _age(directory, seconds):
+        """Backdate every cache entry in directory by the given seconds."""
+        import os
+        import time
+
+        for path in directory.iterdir():
+            t = time.time() - seconds
+            os.utime(path, (t, t))
+
+    def test_disabled_by_default(self, cache, tmp_path, monkeypatch):
+        monkeypatch.delenv("PAPER_SEARCH_CACHE_TTL")
+        fetch = MagicMock(return_value=_mock_response({}))
+        cache.cached_fetch("s2", "https://api/x", {}, fetch)
+        cache.cached_fetch("s2", "https://api/x", {}, fetch)
+        assert fetch.call_count == 2
+        assert not (tmp_path / ".cache").exists()
+
+    @pytest.mark.parametrize("value", ["", "  ", "1d", "abc"])
+    def test_invalid_ttl_disables_cache(self, cache, tmp_path, monkeypatch, caplog, value):
+        monkeypatch.setenv("PAPER_SEARCH_CACHE_TTL", value)
+        cache._warn_bad_ttl.cache_clear()
+        fetch = MagicMock(return_value=_mock_response({"ok": True}))
+        assert cache.cached_fetch("s2", "https://api/x", {}, fetch) == b'{"ok": true}'
+        assert not (tmp_path / ".cache").exists()
+        warned = "PAPER_SEARCH_CACHE_TTL" in caplog.text
+        assert warned == bool(value.strip())
+
+    def test_second_call_served_from_disk(self, cache):
+        fetch = MagicMock(return_value=_mock_response({"data": [1]}))
+
+        first = cache.cached_fetch("s2", "https://api/x", {"b": 2, "a": 1}, fetch)
+        second = cache.cached_fetch("s2", "https://api/x", {"a": 1, "b": 2}, fetch)
+
+        assert first == second == b'{"data": [1]}'
+        fetch.assert_called_once()
+
+    def test_different_params_miss(self, cache):
+        fetch = MagicMock(return_value=_mock_response({}))
+        cache.cached_fetch("s2", "https://api/x", {"q": "a"}, fetch)
+        cache.cached_fetch("s2", "https://api/x", {"q": "b"}, fetch)
+        assert fetch.call_count == 2
+
+    def test_expired_entry_refetched(self, cache, tmp_path):
+        fetch = MagicMock(return_value=_mock_response({}))
+        cache.cached_fetch("s2", "https://api/x", {}, fetch)
+        self._age(tmp_path / ".cache" / "s2", 120)
+        cache.cached_fetch("s2", "https://api/x", {}, fetch)
+        assert fetch.call_count == 2
+
+    def test_write_prunes_expired_entries(self, cache, tmp_path):
+        fetch = MagicMock(return_value=_mock_response({}))
+        cache.cached_fetch("s2", "https://api/x", {"q": "old"}, fetch)
+        self._age(tmp_path / ".cache" / "s2", 120)
+        cache.cached_fetch("s2", "https://api/x", {"q": "new"}, fetch)
+        assert len(list((tmp_path / ".cache" / "s2").iterdir())) == 1
+
+    def test_errors_not_cached(self, cache):
+        bad = _mock_response({})
+        bad.raise_for_status.side_effect = RuntimeError("429")
+        with pytest.raises(RuntimeError):
+            cache.cached_fetch("s2", "https://api/x", {}, lambda: bad)
+
+        fetch = MagicMock(return_value=_mock_response({"ok": True}))
+        assert cache.cached_fetch("s2", "https://api/x", {}, fetch) == b'{"ok": true}'
+        fetch.assert_called_once()
+
+
 # --- Google backend ---
 
 
 class TestGoogleWeb:
-    @patch("search.backends.google.httpx.post")
-    def test_search_web(self, mock_post, monkeypatch):
+    @patch("search.backends.google.get_client")
+    def test_search_web(self, mock_client, monkeypatch):
         monkeypatch.setenv("SERPER_API_KEY", "test-key")
-        mock_post.return_value = _mock_response({
+        mock_client.return_value.post.return_value = _mock_response({
             "organic": [
                 {
                     "title": "RLHF Paper",
@@ -50,12 +152,12 @@ class TestGoogleWeb:
         assert results[0].title == "RLHF Paper"
         assert results[0].arxiv_id == "2204.05862"
         assert results[1].arxiv_id == ""
-        mock_post.assert_called_once()
+        mock_client.return_value.post.assert_called_once()
 
-    @patch("search.backends.google.httpx.post")
-    def test_search_scholar(self, mock_post, monkeypatch):
+    @patch("search.backends.google.get_client")
+    def test_search_scholar(self, mock_client, monkeypatch):
         monkeypatch.setenv("SERPER_API_KEY", "test-key")
-        mock_post.return_value = _mock_response({
+        mock_client.return_value.post.return_value = _mock_response({
             "organic": [
                 {
                     "title": "Attention Is All You Need",
@@ -76,10 +178,10 @@ class TestGoogleWeb:
         assert results[0].citation_count == 100000
         assert results[0].authors == "Vaswani et al."
 
-    @patch("search.backends.google.httpx.post")
-    def test_scholar_year_string(self, mock_post, monkeypatch):
+    @patch("search.backends.google.get_client")
+    def test_scholar_year_string(self, mock_client, monkeypatch):
         monkeypatch.setenv("SERPER_API_KEY", "test-key")
-        mock_post.return_value = _mock_response({
+        mock_client.return_value.post.return_value = _mock_response({
             "organic": [{"title": "T", "link": "", "snippet": "", "year": "2023", "citedBy": 0}]
         })
 
@@ -249,12 +351,42 @@ class TestSemanticScholarDetails:
         assert "et al." in result.authors  # 4 authors -> truncated
 
 
+class TestSemanticScholarBatch:
+    @patch("search.backends.semanticscholar._post")
+    def test_get_papers_batch(self, mock_post):
+        mock_post.return_value = _mock_response([
+            {"paperId": "abc", "title": "First", "authors": []},
+            None,
+        ])
+
+        from search.backends.semanticscholar import get_papers_batch
+        results = get_papers_batch(["abc", "missing"])
+
+        assert results[0].title == "First"
+        assert results[1] is None
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["json"] == {"ids": ["abc", "missing"]}
+
+    @patch("search.backends.semanticscholar._post")
+    def test_splits_large_batches(self, mock_post, monkeypatch):
+        import search.backends.semanticscholar as s2
+        monkeypatch.setattr(s2, "BATCH_MAX_IDS", 2)
+        mock_post.side_effect = lambda url, **kw: _mock_response(
+            [{"paperId": pid, "title": pid} for pid in kw["json"]["ids"]]
+        )
+
+        results = s2.get_papers_batch(["a", "b", "c"])
+
+        assert [r.paper_id for r in results] == ["a", "b", "c"]
+        assert mock_post.call_count == 2
+
+
 # --- PubMed backend ---
 
 
 class TestPubMed:
-    @patch("search.backends.pubmed.httpx.get")
-    def test_search_pubmed(self, mock_get):
+    @patch("search.backends.pubmed.get_client")
+    def test_search_pubmed(self, mock_client):
         # First call: esearch (returns IDs)
         search_xml = b"""<?xml version="1.0"?>
         <eSearchResult>
@@ -304,7 +436,7 @@ class TestPubMed:
         fetch_resp.content = fetch_xml
         fetch_resp.raise_for_status.return_value = None
 
-        mock_get.side_effect = [search_resp, fetch_resp]
+        mock_client.return_value.get.side_effect = [search_resp, fetch_resp]
 
         from search.backends.pubmed import search_pubmed
         results = search_pubmed("CRISPR", limit=1)
@@ -315,8 +447,8 @@ class TestPubMed:
         assert "Smith" in results[0].authors
         assert "pubmed.ncbi.nlm.nih.gov" in results[0].url
 
-    @patch("search.backends.pubmed.httpx.get")
-    def test_search_pubmed_no_results(self, mock_get):
+    @patch("search.backends.pubmed.get_client")
+    def test_search_pubmed_no_results(self, mock_client):
         search_xml = b"""<?xml version="1.0"?>
         <eSearchResult>
             <Count>0</Count>
@@ -329,21 +461,89 @@ class TestPubMed:
         resp.status_code = 200
         resp.content = search_xml
         resp.raise_for_status.return_value = None
-        mock_get.return_value = resp
+        mock_client.return_value.get.return_value = resp
 
         from search.backends.pubmed import search_pubmed
         results = search_pubmed("xyznonexistent")
         assert results == []
 
+    @patch("search.backends.pubmed.get_client")
+    def test_rate_limited_request_retried(self, mock_client, monkeypatch):
+        from tenacity import wait_none
+
+        from search.backends import pubmed
+
+        monkeypatch.setattr(pubmed._get.retry, "wait", wait_none())
+        limited = MagicMock(status_code=429)
+        ok = MagicMock(status_code=200, content=b"<eSearchResult><IdList/></eSearchResult>")
+        mock_client.return_value.get.side_effect = [limited, ok]
+
+        assert pubmed.search_pubmed("q") == []
+        assert mock_client.return_value.get.call_count == 2
+
+    @patch("search.backends.pubmed.get_client")
+    def test_large_result_sets_fetched_in_batches(self, mock_client, monkeypatch):
+        from search.backends import pubmed
+
+        monkeypatch.setattr(pubmed, "EFETCH_BATCH", 2)
+        ids = "".join(f"<Id>{i}</Id>" for i in range(5))
+        search_resp = MagicMock(content=f"<eSearchResult><IdList>{ids}</IdList></eSearchResult>".encode())
+
+        def fake_get(url, params, timeout):
+            if url.endswith("esearch.fcgi"):
+                return search_resp
+            articles = "".join(
+                f"<PubmedArticle><PMID>{pmid}</PMID><Article><ArticleTitle>T{pmid}"
+                f"</ArticleTitle></Article></PubmedArticle>"
+                for pmid in params["id"].split(",")
+            )
+            return MagicMock(content=f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode())
+
+        mock_client.return_value.get.side_effect = fake_get
+
+        results = pubmed.search_pubmed("q", limit=5)
+
+        assert [r.paper_id for r in results] == ["0", "1", "2", "3", "4"]
+        assert mock_client.return_value.get.call_count == 4  # esearch + 3 efetch
+
+    def test_extract_text_keeps_inline_markup_joined(self):
+        from xml.etree import ElementTree
+        from search.backends.pubmed import _extract_text
+
+        el = ElementTree.fromstring(
+            "<AbstractText>Rising CO<sub>2</sub> levels\n   in <i>E. coli</i> cultures.</AbstractText>"
+        )
+        assert _extract_text(el) == "Rising CO2 levels in E. coli cultures."
+
+    def test_iter_articles_streams_in_order_and_skips_incomplete(self):
+        from search.backends.pubmed import _iter_articles
+
+        xml = b"""<?xml version="1.0"?>
+        <PubmedArticleSet>
+            <PubmedArticle><MedlineCitation><PMID>1</PMID>
+                <Article><ArticleTitle>First <i>rich</i> title</ArticleTitle></Article>
+            </MedlineCitation></PubmedArticle>
+            <PubmedArticle><MedlineCitation><PMID>2</PMID></MedlineCitation></PubmedArticle>
+            <PubmedBookArticle><PMID>3</PMID></PubmedBookArticle>
+            <PubmedArticle><MedlineCitation><PMID>4</PMID>
+                <Article><ArticleTitle>Second</ArticleTitle></Article>
+            </MedlineCitation></PubmedArticle>
+        </PubmedArticleSet>"""
+
+        results = list(_iter_articles(xml))
+
+        assert [r.paper_id for r in results] == ["1", "4"]
+        assert results[0].title == "First rich title"
+
 
 # --- Browse backend ---
 
 
 class TestBrowseJina:
-    @patch("search.backends.browse.httpx.get")
-    def test_browse_jina(self, mock_get, monkeypatch):
+    @patch("search.backends.browse.get_client")
+    def test_browse_jina(self, mock_client, monkeypatch):
         monkeypatch.setenv("JINA_API_KEY", "test-key")
-        mock_get.return_value = _mock_response({
+        mock_client.return_value.get.return_value = _mock_response({
             "data": {
                 "url": "https://example.com",
                 "title": "Example Page",
@@ -360,10 +560,10 @@ class TestBrowseJina:
 
 
 class TestBrowseSerper:
-    @patch("search.backends.browse.httpx.post")
-    def test_browse_serper(self, mock_post, monkeypatch):
+    @patch("search.backends.browse.get_client")
+    def test_browse_serper(self, mock_client, monkeypatch):
         monkeypatch.setenv("SERPER_API_KEY", "test-key")
-        mock_post.return_value = _mock_response({
+        mock_client.return_value.post.return_value = _mock_response({
             "markdown": "# Example\n\nSome content here.",
             "metadata": {"title": "Example"},
         })
@@ -376,10 +576,10 @@ class TestBrowseSerper:
 
 
 class TestBrowseDispatch:
-    @patch("search.backends.browse.httpx.get")
-    def test_browse_default_jina(self, mock_get, monkeypatch):
+    @patch("search.backends.browse.get_client")
+    def test_browse_default_jina(self, mock_client, monkeypatch):
         monkeypatch.setenv("JINA_API_KEY", "test-key")
-        mock_get.return_value = _mock_response({"data": {"url": "", "title": "", "content": "ok"}})
+        mock_client.return_value.get.return_value = _mock_response({"data": {"url": "", "title": "", "content": "ok"}})
 
         from search.backends.browse import browse
         result = browse("https://example.com")
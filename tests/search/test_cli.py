@@ -1,5 +1,8 @@
 """Tests for search CLI — command registration and help text."""
 
+import json
+from unittest.mock import patch
+
 import pytest
 from click.testing import CliRunner
 
@@ -116,6 +119,60 @@ class TestSemanticScholarCLI:
         assert result.exit_code == 0
         assert "PAPER_ID" in result.output
 
+    def test_batch_help(self, runner):
+        result = runner.invoke(cli, ["semanticscholar", "batch", "--help"])
+        assert result.exit_code == 0
+        assert "--json" in result.output
+
+    def test_batch_dispatch(self, runner):
+        from search.models import CitationResult, SearchResult
+
+        ops = [
+            {"op": "references", "paper_id": "p1", "limit": 5},
+            {"op": "details", "paper_id": "p2"},
+            {"op": "details", "paper_id": "p3"},
+        ]
+        with patch(
+            "search.backends.semanticscholar.get_papers_batch",
+            return_value=[SearchResult(title="Paper Two", url=""), None],
+        ) as batch, patch(
+            "search.backends.semanticscholar.get_references",
+            return_value=[CitationResult(title="Cited One", paper_id="c1")],
+        ) as refs:
+            result = runner.invoke(
+                cli, ["semanticscholar", "batch"], input=json.dumps(ops),
+            )
+
+        assert result.exit_code == 0, result.output
+        batch.assert_called_once_with(["p2", "p3"])
+        refs.assert_called_once_with("p1", limit=5, offset=0)
+        out = result.output
+        assert out.index("Cited One") < out.index("Paper Two") < out.index("not found")
+
+    def test_batch_rejects_unknown_op(self, runner):
+        result = runner.invoke(
+            cli, ["semanticscholar", "batch"], input='[{"op": "delete", "paper_id": "x"}]',
+        )
+        assert result.exit_code == 2
+        assert "'delete'" in result.output
+
+    @pytest.mark.parametrize("bad", ['"10"', "-1", "true", "2.5"])
+    def test_batch_rejects_bad_limit(self, runner, bad):
+        with patch("search.backends.semanticscholar.get_references") as refs:
+            result = runner.invoke(
+                cli, ["semanticscholar", "batch"],
+                input=f'[{{"op": "references", "paper_id": "p1", "limit": {bad}}}]',
+            )
+        assert result.exit_code == 2
+        assert "limit must be a non-negative integer" in result.output
+        assert "p1" in result.output
+        refs.assert_not_called()
+
+    def test_batch_rejects_invalid_json(self, runner):
+        result = runner.invoke(cli, ["semanticscholar", "batch"], input="[{")
+        assert result.exit_code == 2
+        assert "not valid JSON" in result.output
+
 
 class TestPubMedCLI:
     def test_pubmed_help(self, runner):
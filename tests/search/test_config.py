@@ -96,6 +96,20 @@ class TestSaveKey:
         assert "SERPER_API_KEY=serper-val" in content
         assert "JINA_API_KEY=jina-val" in content
 
+    def test_appends_after_unterminated_last_line(self, tmp_path, monkeypatch):
+        import search.config as config
+        monkeypatch.setattr(config, "PAPERS_DIR", tmp_path)
+        monkeypatch.setattr(config, "PERSISTENT_ENV", tmp_path / ".env")
+        (tmp_path / ".env").write_text("# keys\nSERPER_API_KEY=serper-val")
+
+        save_key("JINA_API_KEY", "jina-val")
+        save_key("SERPER_API_KEY", "new-val")
+
+        assert (tmp_path / ".env").read_text() == (
+            "# keys\nSERPER_API_KEY=new-val\nJINA_API_KEY=jina-val\n"
+        )
+        assert not (tmp_path / ".env.tmp").exists()
+
     def test_sets_in_current_process(self, tmp_path, monkeypatch):
         import search.config as config
         monkeypatch.setattr(config, "PAPERS_DIR", tmp_path)
@@ -104,3 +118,26 @@ class TestSaveKey:
 
         save_key("S2_API_KEY", "s2-test")
         assert os.environ.get("S2_API_KEY") == "s2-test"
+
+
+class TestLoadEnv:
+    @pytest.fixture
+    def persistent(self, tmp_path, monkeypatch):
+        import search.config as config
+
+        path = tmp_path / ".env"
+        path.write_text("PAPER_TEST_A=persistent\n")
+        monkeypatch.setattr(config, "PERSISTENT_ENV", path)
+        config._load_env.cache_clear()
+        yield config
+        config._load_env.cache_clear()
+        config._load_env()
+
+    def test_persistent_env_loaded_on_first_lookup(self, persistent, monkeypatch):
+        monkeypatch.setenv("PAPER_TEST_A", "")
+        monkeypatch.delenv("PAPER_TEST_A")
+        assert persistent.getenv("PAPER_TEST_A") == "persistent"
+
+    def test_shell_env_wins(self, persistent, monkeypatch):
+        monkeypatch.setenv("PAPER_TEST_A", "shell")
+        assert persistent.getenv("PAPER_TEST_A") == "shell"
@@ -1,5 +1,9 @@
 """Tests for search data models."""
 
+import dataclasses
+
+import pytest
+
 from search.models import BrowseResult, CitationResult, SearchResult, SnippetResult
 
 
@@ -81,3 +85,31 @@ class TestBrowseResult:
             word_count=2,
         )
         assert b.word_count == 2
+
+
+class TestResultImmutability:
+    @pytest.mark.parametrize("result", [
+        SearchResult(title="T"),
+        SnippetResult(text="t"),
+        CitationResult(title="T"),
+        BrowseResult(url="https://example.com"),
+    ])
+    def test_frozen_and_slotted(self, result):
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(result, dataclasses.fields(result)[0].name, "changed")
+
+
+class TestStringInterning:
+    @pytest.mark.parametrize("cls", [SearchResult, CitationResult])
+    def test_repeated_venue_and_authors_share_one_object(self, cls):
+        # Build equal strings at runtime so they start out as distinct objects
+        a = cls(title="A", venue="".join(["Neur", "IPS"]), authors="".join(["Ada", " L."]))
+        b = cls(title="B", venue="".join(["Neu", "rIPS"]), authors="".join(["Ad", "a L."]))
+        assert a.venue is b.venue
+        assert a.authors is b.authors
+
+    def test_empty_and_missing_values_untouched(self):
+        r = CitationResult(title="T", venue=None)
+        assert r.venue is None
+        assert SearchResult(title="T").venue == ""
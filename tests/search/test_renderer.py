@@ -165,3 +165,56 @@ class TestRenderBrowseResult:
         output = _capture_output(render_browse_result, result)
         assert "3 words" in output
         assert "Page content here" in output
+
+
+class TestPrintBatching:
+    def test_one_print_per_page(self, monkeypatch):
+        import search.renderer as mod
+
+        console = Console(file=StringIO(), force_terminal=False, width=120)
+        calls = []
+        real_print = console.print
+        monkeypatch.setattr(console, "print", lambda *a, **k: (calls.append(a), real_print(*a, **k)))
+        monkeypatch.setattr(mod, "console", console)
+
+        results = [
+            SearchResult(title=f"P{i}", url="https://arxiv.org/abs/2301.12345",
+                         snippet="s", authors="A", year=2024)
+            for i in range(5)
+        ]
+        render_search_results(results)
+        assert len(calls) == 1
+
+    def test_style_preserved_on_buffered_lines(self):
+        import search.renderer as mod
+
+        buf = StringIO()
+        original = mod.console
+        mod.console = Console(file=buf, force_terminal=True, color_system="standard", width=120)
+        try:
+            render_search_results([SearchResult(title="T", url="https://example.com")])
+        finally:
+            mod.console = original
+        # The URL line keeps its dim style (SGR 2) alongside URL highlighting
+        assert "\x1b[2m" in buf.getvalue() or "\x1b[2;" in buf.getvalue()
+
+
+class TestArxivSuggestions:
+    def test_old_style_arxiv_url_suggests_paper_read(self):
+        results = [SearchResult(title="T", url="https://arxiv.org/abs/hep-th/9901001v1")]
+        output = _capture_output(render_search_results, results)
+        assert "paper read hep-th/9901001" in output
+
+    def test_non_arxiv_url_suggests_browse(self):
+        results = [SearchResult(title="T", url="https://example.com/abs/2301.12345")]
+        output = _capture_output(render_search_results, results)
+        assert "paper-search browse https://example.com/abs/2301.12345" in output
+        assert "paper read" not in output
+
+
+class TestFormatMeta:
+    def test_skips_missing_fields(self):
+        from search.renderer import _format_meta
+        assert _format_meta("A", None, "", None) == "A"
+        assert _format_meta("", 2024, None, 0) == "2024 | cited by 0"
+        assert _format_meta("", None, "", None) == ""
@@ -0,0 +1,28 @@
+"""Tests for search.util helpers."""
+
+import pytest
+
+from search.util import extract_arxiv_id
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://arxiv.org/abs/2204.05862", "2204.05862"),
+    ("https://arxiv.org/abs/2204.05862v3", "2204.05862"),
+    ("https://arxiv.org/pdf/2204.05862v1.pdf", "2204.05862"),
+    ("https://arxiv.org/pdf/2204.05862", "2204.05862"),
+    ("https://arxiv.org/abs/2204.05862?context=cs", "2204.05862"),
+    ("https://arxiv.org/abs/hep-th/9901001v2", "hep-th/9901001"),
+    ("https://arxiv.org/abs/solv-int/9901001", "solv-int/9901001"),
+    ("https://blog.example.com/rlhf", ""),
+    ("", ""),
+])
+def test_extract_arxiv_id(url, expected):
+    assert extract_arxiv_id(url) == expected
+
+
+def test_extract_arxiv_id_is_memoized():
+    extract_arxiv_id.cache_clear()
+    url = "https://arxiv.org/abs/2204.05862v3"
+    extract_arxiv_id(url)
+    extract_arxiv_id(url)
+    assert extract_arxiv_id.cache_info().hits == 1
@@ -52,6 +52,23 @@ class TestCLI:
             result = runner.invoke(cli, [cmd, "--help"])
             assert "--no-refs" in result.output, f"--no-refs missing from {cmd}"
 
+    def test_read_section_with_refs(self, runner, monkeypatch):
+        from paper import cli as cli_mod
+        from paper.models import Document, Metadata, Section
+
+        doc = Document(
+            metadata=Metadata(title="Test", arxiv_id="2302.13971"),
+            sections=[
+                Section(heading="Introduction", level=1, content="Intro text."),
+                Section(heading="Method", level=1, content="Method text."),
+            ],
+        )
+        monkeypatch.setattr(cli_mod, "_load", lambda reference: doc)
+        result = runner.invoke(cli, ["--no-header", "read", "2302.13971", "Method"])
+        assert result.exit_code == 0, result.output
+        assert "Method text." in result.output
+        assert "Refs:" in result.output
+
     def test_invalid_reference(self, runner):
         result = runner.invoke(cli, ["outline", "not-a-paper"])
         assert result.exit_code != 0
@@ -296,7 +296,7 @@ class TestRendererLayoutRefs:
         assert eq1.kind == "equation"
 
     def test_ref_summary_includes_layout(self):
-        from paper.renderer import build_ref_registry, _ref_summary
+        from paper.renderer import build_ref_registry, _build_indexes, _ref_summary
 
         doc = Document(
             metadata=Metadata(title="Test"),
@@ -311,11 +311,28 @@ class TestRendererLayoutRefs:
         )
 
         registry = build_ref_registry(doc)
-        summary = _ref_summary(registry)
+        summary = _ref_summary(_build_indexes(doc, registry).kind_counts)
 
         assert "f1..f2 (figures)" in summary
         assert "t1..t1 (tables)" in summary
 
+    def test_indexes_map_layout_labels_to_ref_ids(self):
+        from paper.renderer import build_ref_registry, _build_indexes
+
+        doc = Document(
+            metadata=Metadata(title="Test"),
+            layout_elements=[
+                LayoutElement(kind="figure", box=Box(0, 0, 1, 1, 0),
+                              confidence=0.9, label="Figure 1"),
+                LayoutElement(kind="equation", box=Box(0, 0, 1, 1, 1),
+                              confidence=0.9, label="Eq. 1"),
+            ],
+        )
+
+        indexes = _build_indexes(doc, build_ref_registry(doc))
+
+        assert indexes.layout_refs == {"Figure 1": "f1", "Eq. 1": "eq1"}
+
     def test_empty_layout_no_layout_refs(self):
         from paper.renderer import build_ref_registry
 
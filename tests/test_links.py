@@ -4,9 +4,10 @@ import pytest
 
 from paper.models import Document, Link, Metadata, Section, Sentence, Span
 from paper.parser import _detect_citations
+from paper import renderer
 from paper.renderer import (
-    RefEntry, build_ref_registry, render_goto,
-    annotate_text, _find_cite_end_in_text,
+    RefEntry, build_ref_registry, render_goto, render_outline,
+    annotate_text, _find_cite_end_in_text, _build_indexes, _extract_ref_from_pdf,
 )
 
 
@@ -130,6 +131,40 @@ class TestBuildRefRegistry:
         registry = build_ref_registry(doc)
         assert registry == []
 
+    def test_registry_cached_per_document(self):
+        doc = self._make_doc()
+        assert build_ref_registry(doc) is build_ref_registry(doc)
+        assert build_ref_registry(doc) is not build_ref_registry(self._make_doc())
+
+    def test_cache_rebuilt_when_layout_added(self):
+        from paper.models import Box, LayoutElement
+
+        doc = self._make_doc()
+        before = build_ref_registry(doc)
+        doc.layout_elements = [LayoutElement(kind="figure", box=Box(0, 0, 1, 1, 0),
+                                             confidence=0.9, label="Figure 1")]
+        after = build_ref_registry(doc)
+        assert after is not before
+        assert "f1" in [e.ref_id for e in after]
+
+    def test_cache_released_with_document(self):
+        import gc
+
+        doc = self._make_doc()
+        build_ref_registry(doc)
+        key = id(doc)
+        assert key in renderer._REF_CACHE
+        del doc
+        gc.collect()
+        assert key not in renderer._REF_CACHE
+
+    def test_entries_are_immutable(self):
+        doc = self._make_doc(num_sections=1, num_ext_links=0, num_citations=0)
+        entry = build_ref_registry(doc)[0]
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.ref_id = "s99"
+
 
 class TestRenderGoto:
     def _make_doc(self):
@@ -176,11 +211,26 @@ class TestRenderGoto:
         result = render_goto(doc, "e1")
         assert result is True
 
+    def test_goto_external_reports_section(self, capsys):
+        doc = self._make_doc()
+        doc.links[0].span = Span(start=150, end=160)
+        assert render_goto(doc, "e1", show_header=False) is True
+        assert "Found in: References (p.1)" in capsys.readouterr().out
+
     def test_goto_citation(self):
         doc = self._make_doc()
         result = render_goto(doc, "c1")
         assert result is True
 
+    def test_goto_citation_resolves_from_references(self, capsys):
+        doc = self._make_doc()
+        doc.sections[1].heading = "Bibliography"
+        doc.sections[1].content = "1. Smith et al. A great paper. 2023.\n2. Jones. Another. 2022."
+        assert render_goto(doc, "c1", show_header=False) is True
+        captured = capsys.readouterr().out
+        assert "Smith et al. A great paper. 2023." in captured
+        assert "Jones" not in captured
+
     def test_goto_section_truncates(self, capsys):
         """Long sections should be truncated to 10 sentences with a hint."""
         doc = Document(
@@ -310,6 +360,150 @@ class TestInlineCitationPlacement:
         method_pos = result.find("the method")
         assert ref_pos < method_pos
 
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_annotate_fallback_prefers_longest_marker(self, monkeypatch, use_automaton):
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(renderer, "_build_cite_automaton", lambda _: None)
+        doc = Document(links=[
+            Link(kind="citation", text="[1]", url="", target_page=-1, page=0,
+                 span=Span(start=0, end=3)),
+            Link(kind="citation", text="[1, 2]", url="", target_page=-1, page=0,
+                 span=Span(start=5, end=11)),
+        ])
+        registry = build_ref_registry(doc)
+        result = annotate_text("See [1, 2] then [1].", doc, registry)
+        assert result == ("See [1, 2] [dim]\\[ref=c2][/dim] then "
+                          "[1] [dim]\\[ref=c1][/dim].")
+
+    def test_annotate_fallback_without_spans(self):
+        """Lines without spans are matched by marker text, once per ref."""
+        doc = Document(links=[
+            Link(kind="citation", text="[1]", url="", target_page=-1, page=0,
+                 span=Span(start=0, end=3)),
+            Link(kind="citation", text="[2]", url="", target_page=-1, page=0,
+                 span=Span(start=5, end=8)),
+        ])
+        registry = build_ref_registry(doc)
+        seen = set()
+        result = annotate_text("See [2] and [1].", doc, registry, seen_refs=seen)
+        assert result == "See [2] [dim]\\[ref=c2][/dim] and [1] [dim]\\[ref=c1][/dim]."
+        assert seen == {"c1", "c2"}
+        assert annotate_text("Again [1].", doc, registry, seen_refs=seen) == "Again [1]."
+
+
+class TestRenderOutline:
+    def test_nesting_with_skipped_levels(self, monkeypatch):
+        doc = Document(sections=[
+            Section(heading="Intro", level=1, content=""),
+            Section(heading="Deep", level=3, content=""),
+            Section(heading="Sub", level=2, content=""),
+            Section(heading="Methods", level=1, content=""),
+        ])
+        printed = []
+        monkeypatch.setattr(renderer.console, "print", lambda *a, **k: printed.extend(a))
+        render_outline(doc, refs=False, show_header=False)
+        tree = printed[0]
+        intro, methods = tree.children
+        assert "Intro" in intro.label and "Methods" in methods.label
+        assert [c.label for c in intro.children] == ["Deep", "Sub"]
+
+
+class TestIndexes:
+    def _cite(self, text, start, end):
+        return Link(kind="citation", text=text, url="", target_page=-1,
+                    page=0, span=Span(start=start, end=end))
+
+    def test_overlapping_cites(self):
+        doc = Document(links=[
+            self._cite("[2]", 40, 43),
+            self._cite("(Smith et al., 2020)", 5, 25),
+            self._cite("[3]", 90, 93),
+        ])
+        indexes = _build_indexes(doc, build_ref_registry(doc))
+        assert list(indexes.cite_starts) == [5, 40, 90]
+        # Span starting before the window but ending inside it still overlaps
+        assert [r for _, _, r in indexes.overlapping_cites(20, 50)] == ["c2", "c1"]
+        assert indexes.overlapping_cites(25, 40) == []
+        assert indexes.overlapping_cites(92, 200) == [(90, 93, "c3")]
+
+    def test_first_external_link_and_layout_element_win(self):
+        from paper.models import Box, LayoutElement
+
+        ext = [Link(kind="external", text=t, url="https://x.org", target_page=-1,
+                    page=p, span=Span(start=0, end=1)) for t, p in (("a", 0), ("b", 3))]
+        figs = [LayoutElement(kind="figure", box=Box(0, 0, 1, 1, p), confidence=0.9,
+                              label="Figure 1") for p in (0, 1)]
+        doc = Document(links=ext, layout_elements=figs)
+        indexes = _build_indexes(doc, build_ref_registry(doc))
+        assert indexes.external_links["https://x.org"] is ext[0]
+        assert indexes.layout_by_label["Figure 1"] is figs[0]
+
+
+class TestExtractRefFromPdf:
+    @pytest.fixture
+    def refs_pdf(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        pdf = fitz.open()
+        page = pdf.new_page(width=612, height=792)
+        lines = [
+            (50, "Zhao, W. X. et al. A survey of language models."),
+            (60, "arXiv preprint, 2023."),
+            (50, "Smith, A. Something else entirely. 2019."),
+            (50, "Jones, B. Yet another paper. 2021."),
+            (50, "Zhao, Y. and Hu, E. Adapters. In ACL, 2024."),
+        ]
+        for i, (x, line) in enumerate(lines):
+            page.insert_text((x, 72 + 14 * i), line, fontsize=8)
+        page.insert_text((310, 72), "Hu, E. J. et al. LoRA: Low-rank adaptation. 2022.", fontsize=8)
+        page.insert_text((50, 300), "KINGMA, D. P. Adam: A method for optimization. 2015.", fontsize=8)
+        page.insert_text((50, 360), "[7]Lee, K. Retrieval heads. 2020.", fontsize=8)
+        path = tmp_path / "paper.pdf"
+        pdf.save(path)
+        return path
+
+    def _link(self, text):
+        return Link(kind="citation", text=text, url="", target_page=0, page=0,
+                    span=Span(start=0, end=0))
+
+    def test_year_disambiguates_surname(self, refs_pdf):
+        text = _extract_ref_from_pdf(refs_pdf, self._link("(Zhao et al., 2024)"))
+        assert text == "Zhao, Y. and Hu, E. Adapters. In ACL, 2024."
+
+    def test_right_column(self, refs_pdf):
+        text = _extract_ref_from_pdf(refs_pdf, self._link("(Hu et al., 2022)"))
+        assert text == "Hu, E. J. et al. LoRA: Low-rank adaptation. 2022."
+
+    def test_surname_matched_case_insensitively(self, refs_pdf):
+        text = _extract_ref_from_pdf(refs_pdf, self._link("(Kingma & Ba, 2015)"))
+        assert text == "KINGMA, D. P. Adam: A method for optimization. 2015."
+
+    def test_surname_inside_longer_word(self, refs_pdf):
+        text = _extract_ref_from_pdf(refs_pdf, self._link("(Lee, 2020)"))
+        assert text == "Lee, K. Retrieval heads. 2020."
+
+    def test_unknown_author(self, refs_pdf):
+        assert _extract_ref_from_pdf(refs_pdf, self._link("(Nobody, 2020)")) is None
+
+    def test_missing_pdf(self, tmp_path):
+        assert _extract_ref_from_pdf(tmp_path / "gone.pdf", self._link("(Zhao, 2024)")) is None
+
+    def test_pdf_handle_reused_until_file_changes(self, refs_pdf):
+        import os
+        from paper.renderer import _PDF_CACHE
+
+        _extract_ref_from_pdf(refs_pdf, self._link("(Hu et al., 2022)"))
+        handle = _PDF_CACHE[str(refs_pdf)][1]
+        _extract_ref_from_pdf(refs_pdf, self._link("(Zhao et al., 2024)"))
+        assert _PDF_CACHE[str(refs_pdf)][1] is handle
+
+        st = refs_pdf.stat()
+        os.utime(refs_pdf, (st.st_atime, st.st_mtime + 10))
+        _extract_ref_from_pdf(refs_pdf, self._link("(Hu et al., 2022)"))
+        assert _PDF_CACHE[str(refs_pdf)][1] is not handle
+        assert handle.is_closed
+
 
 class TestGotoCLI:
     def test_goto_help(self):
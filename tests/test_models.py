@@ -46,6 +46,20 @@ class TestDocumentSerialization:
         assert loaded.sections[0].sentences[0].text == "This is the intro."
         assert loaded.raw_text == "Introduction\nThis is the intro."
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_and_load_share_json_backend(self, tmp_path, monkeypatch, use_orjson):
+        from paper import jsonio
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(jsonio, "orjson", None)
+        doc = Document(metadata=Metadata(title="Übersicht — 综述"), raw_text="é")
+        path = tmp_path / "parsed.json"
+        doc.save(path)
+        assert "Übersicht" in path.read_text(encoding="utf-8")
+        assert Document.load(path).metadata.title == "Übersicht — 综述"
+
     def test_empty_document(self, tmp_path):
         doc = Document()
         path = tmp_path / "empty.json"
@@ -98,3 +112,23 @@ class TestDocumentSerialization:
         path.write_text(json.dumps(data))
         loaded = Document.load(path)
         assert loaded.links == []
+
+
+class TestReferencesSection:
+    def test_finds_bibliography(self):
+        doc = Document(sections=[
+            Section(heading="Introduction", level=1, content=""),
+            Section(heading="Bibliography", level=1, content="[1] Smith."),
+        ])
+        assert doc.references_section is doc.sections[1]
+
+    def test_none_without_references(self):
+        doc = Document(sections=[Section(heading="Methods", level=1, content="")])
+        assert doc.references_section is None
+
+    def test_not_serialized(self, tmp_path):
+        doc = Document(sections=[Section(heading="References", level=1, content="")])
+        assert doc.references_section is not None
+        path = tmp_path / "parsed.json"
+        doc.save(path)
+        assert "references_section" not in path.read_text()
@@ -0,0 +1,113 @@
+"""Tests for paper.renderer — search and highlight output."""
+
+from rich.style import Style
+from rich.text import Text
+
+from paper import renderer
+from paper.models import Document, Metadata, Section
+from paper.renderer import (
+    _newline_offsets,
+    render_highlight_matches,
+    render_search_results,
+    render_section,
+    render_skim,
+)
+
+
+def _printed_texts(monkeypatch) -> list[Text]:
+    printed: list = []
+    monkeypatch.setattr(renderer.console, "print", lambda *a, **k: printed.extend(a))
+    return printed
+
+
+def _doc(content: str) -> Document:
+    return Document(
+        metadata=Metadata(title="Test", arxiv_id="test"),
+        sections=[Section(heading="Intro", level=1, content=content, page_start=2)],
+    )
+
+
+class TestNewlineOffsets:
+    def test_matches_character_scan(self):
+        for text in ["", "no newline", "\n", "ab\nc\n", "\n\nab\n", "é\nü\n\nz"]:
+            assert _newline_offsets(text) == [i for i, c in enumerate(text) if c == "\n"]
+
+
+class TestBatchedSectionMarkup:
+    CONTENT = "We index a[i] in the loop.\nThe second sentence is plain."
+
+    @staticmethod
+    def _second_sentence_italic(printed: list) -> bool:
+        body = next(t for t in printed if isinstance(t, Text) and "second sentence" in t.plain)
+        start = body.plain.index("The second")
+        return any(
+            span.end > start and Style.parse(str(span.style)).italic
+            for span in body.spans
+        )
+
+    def test_render_section_keeps_open_tag_to_its_line(self, monkeypatch):
+        printed = _printed_texts(monkeypatch)
+        render_section(_doc(self.CONTENT).sections[0], refs=False)
+        assert not self._second_sentence_italic(printed)
+
+    def test_render_skim_keeps_open_tag_to_its_line(self, monkeypatch):
+        printed = _printed_texts(monkeypatch)
+        render_skim(_doc(self.CONTENT), refs=False, show_header=False)
+        assert not self._second_sentence_italic(printed)
+
+
+class TestRenderSearchResults:
+    CONTENT = "alpha\nbeta Foo gamma\ndelta\nepsilon\nzeta foo"
+
+    def test_counts_case_insensitive_matches(self, capsys):
+        count = render_search_results(_doc(self.CONTENT), "foo", refs=False, show_header=False)
+        assert count == 2
+        out = capsys.readouterr().out
+        assert "Match 1" in out and "Match 2" in out
+        assert "(p.3)" in out
+        assert "2 match(es) found" in out
+
+    def test_context_spans_following_lines(self, capsys):
+        render_search_results(_doc(self.CONTENT), "Foo", context_lines=2,
+                              refs=False, show_header=False)
+        out = capsys.readouterr().out
+        first, second = out.split("Match 2")
+        assert "beta Foo gamma" in first and "delta" in first
+        assert "alpha" not in first and "epsilon" not in first
+        # Last line has no trailing newline: context runs to end of text
+        assert "zeta foo" in second
+
+    def test_zero_context_lines_stops_at_match(self, capsys):
+        render_search_results(_doc(self.CONTENT), "foo", context_lines=0,
+                              refs=False, show_header=False)
+        out = capsys.readouterr().out
+        assert "beta Foo" in out
+        assert "gamma" not in out
+
+    def test_no_matches(self, capsys):
+        count = render_search_results(_doc(self.CONTENT), "missing", refs=False, show_header=False)
+        assert count == 0
+        assert 'No matches found for "missing"' in capsys.readouterr().out
+
+    def test_regex_metacharacters_are_literal(self, capsys):
+        count = render_search_results(_doc("cost is $5 (approx.)"), "(approx.)",
+                                      refs=False, show_header=False)
+        assert count == 1
+
+    def test_highlights_every_occurrence_in_context(self, monkeypatch):
+        printed = _printed_texts(monkeypatch)
+        render_search_results(_doc("Foo and FOO and foo"), "foo",
+                              refs=False, show_header=False)
+        highlighted = [t for t in printed if isinstance(t, Text) and t.plain.startswith("Foo")][0]
+        assert [(sp.start, sp.end, sp.style) for sp in highlighted.spans] == [
+            (0, 3, "bold red"), (8, 11, "bold red"), (16, 19, "bold red"),
+        ]
+
+
+class TestRenderHighlightMatches:
+    def test_highlights_query_case_insensitively(self, monkeypatch):
+        printed = _printed_texts(monkeypatch)
+        matches = [{"page": 0, "context": "Attention is all you need. ATTENTION!"}]
+        render_highlight_matches(matches, "attention", _doc(""), show_header=False)
+        highlighted = [t for t in printed if isinstance(t, Text) and t.plain.startswith("Attention")][0]
+        assert [(sp.start, sp.end) for sp in highlighted.spans] == [(0, 9), (27, 36)]
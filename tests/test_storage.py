@@ -3,7 +3,7 @@
 import json
 import pytest
 
-from paper import storage
+from paper import jsonio, storage
 
 
 @pytest.fixture
@@ -49,6 +49,20 @@ class TestStorage:
         assert d.exists()
         assert d.name == "2302.13971"
 
+    def test_paper_dir_recreated_after_removal(self, tmp_papers_dir):
+        import shutil
+
+        d = storage.paper_dir("2302.13971")
+        shutil.rmtree(d)
+        storage.save_metadata("2302.13971", {"title": "LLaMA"})
+        assert (d / "metadata.json").exists()
+
+    def test_has_checks_do_not_create_directory(self, tmp_papers_dir):
+        assert not storage.has_pdf("2302.13971")
+        assert not storage.has_parsed("2302.13971")
+        assert not storage.has_layout("2302.13971")
+        assert not (tmp_papers_dir / "2302.13971").exists()
+
     def test_pdf_path(self, tmp_papers_dir):
         p = storage.pdf_path("2302.13971")
         assert p.name == "paper.pdf"
@@ -68,6 +82,36 @@ class TestStorage:
         meta = storage.load_metadata("2302.13971")
         assert meta["title"] == "LLaMA"
 
+    def test_load_metadata_reads_file_once(self, tmp_papers_dir, monkeypatch):
+        storage.save_metadata("2302.13971", {"title": "LLaMA"})
+        calls = []
+        real = storage._safe_json_load
+        monkeypatch.setattr(storage, "_safe_json_load",
+                            lambda *a, **kw: calls.append(a) or real(*a, **kw))
+        storage.load_metadata("2302.13971")
+        storage.load_metadata("2302.13971")
+        assert calls == []
+
+    def test_load_metadata_returns_independent_copy(self, tmp_papers_dir):
+        storage.save_metadata("2302.13971", {"title": "LLaMA"})
+        storage.load_metadata("2302.13971")["title"] = "changed"
+        assert storage.load_metadata("2302.13971") == {"title": "LLaMA"}
+
+    def test_load_metadata_copy_is_deep(self, tmp_papers_dir):
+        storage.save_metadata("2302.13971", {"authors": ["Touvron"]})
+        storage.load_metadata("2302.13971")["authors"].append("changed")
+        assert storage.load_metadata("2302.13971") == {"authors": ["Touvron"]}
+
+    def test_load_metadata_sees_external_edit(self, tmp_papers_dir):
+        import os
+
+        storage.save_metadata("2302.13971", {"title": "LLaMA"})
+        p = storage.metadata_path("2302.13971")
+        p.write_text('{"title": "Edited"}')
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert storage.load_metadata("2302.13971") == {"title": "Edited"}
+
     def test_load_metadata_missing(self, tmp_papers_dir):
         assert storage.load_metadata("nonexistent") is None
 
@@ -101,6 +145,61 @@ class TestCorruptedJson:
         assert papers["2302.13971"] == "LLaMA"
 
 
+class TestJsonBackend:
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(jsonio, "orjson", None)
+        return request.param
+
+    def test_round_trip_non_ascii(self, tmp_papers_dir, backend):
+        meta = {"title": "Übersicht — 综述", "year": 2024}
+        storage.save_metadata("2302.13971", meta)
+        assert storage.load_metadata("2302.13971") == meta
+        raw = storage.metadata_path("2302.13971").read_text(encoding="utf-8")
+        assert "Übersicht" in raw
+        assert '\n  "title": ' in raw
+
+    def test_index_written_compact(self, tmp_papers_dir, backend):
+        storage.update_index("2302.13971", "LLaMA")
+        assert b"\n" not in storage.index_path().read_bytes()
+        assert storage.list_papers() == {"2302.13971": "LLaMA"}
+
+    def test_corrupted_file_returns_fallback(self, tmp_papers_dir, backend):
+        (tmp_papers_dir / "index.json").write_bytes(b"{bad")
+        assert storage.list_papers() == {}
+
+    def test_large_file_round_trip(self, tmp_papers_dir, backend, monkeypatch):
+        monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 16)
+        highlights = [{"id": i, "text": "é" * 50} for i in range(100)]
+        storage.save_highlights("2302.13971", highlights)
+        assert storage.load_highlights("2302.13971") == highlights
+
+    def test_large_corrupted_file_returns_fallback(self, tmp_papers_dir, backend, monkeypatch):
+        monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 16)
+        (tmp_papers_dir / "index.json").write_bytes(b'{"a": "' + b"x" * 100)
+        assert storage.list_papers() == {}
+
+    def test_header_marker_round_trip(self, tmp_papers_dir, backend, monkeypatch):
+        monkeypatch.setattr(storage, "_LAST_HEADER_PATH", tmp_papers_dir / ".last_header")
+        storage.mark_header_shown("2302.13971")
+        assert storage.was_header_shown_recently("2302.13971")
+        assert not storage.was_header_shown_recently("other")
+
+
+class TestHeaderMarker:
+    def test_torn_marker_means_not_shown(self, tmp_papers_dir, monkeypatch):
+        marker = tmp_papers_dir / ".last_header"
+        monkeypatch.setattr(storage, "_LAST_HEADER_PATH", marker)
+        marker.write_bytes(b'{"paper_id": "2302.1')
+        assert not storage.was_header_shown_recently("2302.13971")
+        storage.mark_header_shown("2302.13971")
+        assert storage.was_header_shown_recently("2302.13971")
+        assert not marker.with_suffix(".tmp").exists()
+
+
 class TestLocalCacheStaleness:
     def test_arxiv_paper_not_stale(self, tmp_papers_dir):
         """Arxiv papers (no 'source' key) are never considered stale."""
@@ -131,6 +230,14 @@ class TestLocalCacheStaleness:
         pdf.unlink()
         assert not storage.is_local_cache_stale("paper-abc12345")
 
+    def test_source_replaced_by_directory_not_stale(self, tmp_papers_dir, tmp_path):
+        pdf = tmp_path / "paper.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        storage.save_local_metadata("paper-abc12345", pdf)
+        pdf.unlink()
+        pdf.mkdir()
+        assert not storage.is_local_cache_stale("paper-abc12345")
+
     def test_no_metadata_not_stale(self, tmp_papers_dir):
         """Missing metadata means not stale."""
         assert not storage.is_local_cache_stale("nonexistent")